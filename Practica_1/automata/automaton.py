@@ -1,7 +1,8 @@
 """Automaton implementation."""
-from typing import Collection, Set, Optional, Dict
+from typing import Collection, Set, Optional, Dict, FrozenSet, Hashable, Iterable, List, Mapping, Sequence, Tuple
 from typing_extensions import final
 
+from automata.compiled import CompiledAutomaton
 from automata.interfaces import (
     AbstractFiniteAutomaton,
     AbstractState,
@@ -14,7 +15,11 @@ class State(AbstractState):
 
     # You can add new attributes and methods that you think that make your
     # task easier, but you cannot change the constructor interface.
-    transitions: Dict[Optional[str], Set['State']]
+    __slots__ = ("transitions",)
+
+    # Los destinos de cada simbolo se guardan en tuplas, mas compactas que
+    # los conjuntos para los pocos destinos que suele tener un estado
+    transitions: Dict[Optional[str], Tuple['State', ...]]
 
     def __init__(self, name: str, *, is_final: bool = False) -> None:
         super().__init__(name=name, is_final=is_final)
@@ -26,25 +31,67 @@ class State(AbstractState):
         """
         for t in trans:
             if t.initial_state == self :
-                if t.symbol in self.transitions :
-                    # If key 'symbol' exists in the dict update entry
-                    self.transitions[t.symbol].add(t.final_state)
-                else :
-                    # Create new entry
-                    self.transitions[t.symbol] = {t.final_state}
+                self.add_transition(t.symbol, t.final_state)
         return
 
-    def get_transitions(self, symbol: Optional[str]) -> Set['State']:
+    def add_transition(self, symbol: Optional[str], final_state: 'State') -> None:
         """
-        Obtain set of final states reached from this state using the arg symbol.
+        Add one transition from this state to the dictionary
         """
-        return self.transitions.get(symbol, set())
+        targets = self.transitions.get(symbol, ())
+        if final_state not in targets:
+            self.transitions[symbol] = targets + (final_state,)
+
+    def get_transitions(self, symbol: Optional[str]) -> Tuple['State', ...]:
+        """
+        Obtain the final states reached from this state using the arg symbol.
+        """
+        return self.transitions.get(symbol, ())
 
 class Transition(AbstractTransition[State]):
     """Transition of an automaton."""
 
     # You can add new attributes and methods that you think that make your
     # task easier, but you cannot change the constructor interface.
+    __slots__ = ()
+
+
+def _index_transitions(
+    transitions: Iterable[Transition],
+    canonical: Optional[Mapping[State, State]] = None,
+) -> None:
+    """
+    Add transitions to the dictionaries of their initial states.
+
+    The targets of each state and symbol are collected in lists and frozen
+    to tuples once at the end, so indexing is linear in the number of
+    transitions instead of quadratic in the number of targets of a state.
+    Targets that the state already had are kept, with no repetitions.
+
+    Args:
+        transitions: Transitions to index.
+        canonical: Object of the automaton for each initial state, if the
+            transitions may use other objects equal to them.
+
+    """
+    pending: Dict[State, Dict[Optional[str], List[State]]] = {}
+    for t in transitions:
+        st = t.initial_state if canonical is None else canonical[t.initial_state]
+        row = pending.get(st)
+        if row is None:
+            row = pending[st] = {}
+        targets = row.get(t.symbol)
+        if targets is None:
+            row[t.symbol] = [t.final_state]
+        else:
+            targets.append(t.final_state)
+
+    for st, row in pending.items():
+        for symbol, targets in row.items():
+            # dict.fromkeys quita los repetidos manteniendo el orden
+            st.transitions[symbol] = tuple(
+                dict.fromkeys((*st.transitions.get(symbol, ()), *targets)),
+            )
 
 
 class FiniteAutomaton(
@@ -52,6 +99,9 @@ class FiniteAutomaton(
 ):
     """Automaton."""
 
+    _lambda_closures: Optional[Dict[State, FrozenSet[State]]]
+    _symbol_classes: Optional[List[Tuple[str, ...]]]
+
     def __init__(
         self,
         *,
@@ -68,30 +118,162 @@ class FiniteAutomaton(
         )
         # Add here additional initialization code.
 
-        for s in self.states:
-            s.set_transitions(self.transitions)
+        # Indexamos las transiciones en una sola pasada, asignandolas al
+        # objeto estado del automata que sea igual a su estado inicial
+        canonical = {s: s for s in self.states}
+        _index_transitions(self.transitions, canonical)
+
+        # Clausuras lambda y clases de simbolos, calculadas la primera vez
+        # que se necesitan
+        self._lambda_closures = None
+        self._symbol_classes = None
 
         # Do not change the constructor interface.
+
+    @classmethod
+    def from_trusted(
+        cls,
+        *,
+        initial_state: State,
+        states: Collection[State],
+        symbols: Collection[str],
+        transitions: Collection[Transition],
+    ) -> "FiniteAutomaton":
+        """
+        Create an automaton without validating its components.
+
+        Only meant for internal algorithms whose output is already known to
+        be valid: the states of the transitions must be the same objects as
+        in ``states``, with no repeated states, symbols or transitions.
+
+        Args:
+            initial_state: The initial state of the automaton.
+            states: Collection of states of the automaton.
+            symbols: Collection of symbols of the automaton.
+            transitions: Collection of transitions of the automaton.
+
+        Returns:
+            The new automaton.
+
+        """
+        automaton = cls.__new__(cls)
+        automaton.initial_state = initial_state
+        automaton.states = tuple(states)
+        automaton.symbols = tuple(symbols)
+        automaton.transitions = tuple(transitions)
+
+        _index_transitions(automaton.transitions)
+
+        automaton._lambda_closures = None
+        automaton._symbol_classes = None
+        return automaton
+
+    def symbol_classes(self) -> List[Tuple[str, ...]]:
+        """
+        Partition the alphabet in classes of interchangeable symbols.
+
+        Two symbols are in the same class when every state has exactly the
+        same targets with both of them, so algorithms can work with one
+        representative per class. The partition is computed once per
+        automaton, in a single pass over the transitions.
+
+        Returns:
+            Classes of symbols, in alphabet order. The first symbol of each
+            class is used as its representative.
+
+        """
+        if self._symbol_classes is None:
+            # Firma de cada simbolo: los pares (estado, destinos) que lo usan
+            signatures: Dict[str, List[Tuple[State, FrozenSet[State]]]] = {
+                sym: [] for sym in self.symbols
+            }
+            for st in self.states:
+                for sym, targets in st.transitions.items():
+                    if sym is not None:
+                        signatures[sym].append((st, frozenset(targets)))
+
+            classes: Dict[FrozenSet[Tuple[State, FrozenSet[State]]], List[str]] = {}
+            for sym in sorted(self.symbols):
+                classes.setdefault(frozenset(signatures[sym]), []).append(sym)
+            self._symbol_classes = [tuple(c) for c in classes.values()]
+
+        return self._symbol_classes
+
+    def _get_lambda_closures(self) -> Dict[State, FrozenSet[State]]:
+        """
+        Obtain the lambda closure of every state, computed once per automaton.
+
+        The strongly connected components of the lambda transitions are found
+        with an iterative version of Tarjan's algorithm. Components are
+        completed in reverse topological order, so the closure of a component
+        is its own states plus the already computed closures of the
+        components it reaches.
+        """
+        if self._lambda_closures is not None:
+            return self._lambda_closures
+
+        closures: Dict[State, FrozenSet[State]] = {}
+        index: Dict[State, int] = {}
+        lowlink: Dict[State, int] = {}
+        stack: List[State] = []
+        on_stack: Set[State] = set()
+
+        for root in self.states:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            # Pila de llamadas explicita: (estado, iterador de sus lambdas)
+            work = [(root, iter(root.get_transitions(None)))]
+            while work:
+                st, linked_iter = work[-1]
+                for linked in linked_iter:
+                    if linked not in index:
+                        index[linked] = lowlink[linked] = len(index)
+                        stack.append(linked)
+                        on_stack.add(linked)
+                        work.append((linked, iter(linked.get_transitions(None))))
+                        break
+                    if linked in on_stack:
+                        lowlink[st] = min(lowlink[st], index[linked])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[st])
+
+                    if lowlink[st] == index[st]:
+                        # st es la raiz de una componente: la sacamos de la pila
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member is st:
+                                break
+
+                        closure = set(component)
+                        for member in component:
+                            for linked in member.get_transitions(None):
+                                if linked not in closure:
+                                    closure.update(closures[linked])
+
+                        frozen_closure = frozenset(closure)
+                        for member in component:
+                            closures[member] = frozen_closure
+
+        self._lambda_closures = closures
+        return closures
+
     def _get_lambda_closure(self, set_to_complete: Set[State]) -> None:
         """
         Given a set of states , returns the set of states connected by lambda
         """
-        # Auxiliary set of already expanded states and expected to expand
-        expanded_states = set()
-        to_expand_states = set()
-        to_expand_states.update(set_to_complete)
-
-        while len(to_expand_states) > 0:
-            # Completing lambdas doesnt need an specific order (random with pop)
-            check_state = to_expand_states.pop()
-            expanded_states.add(check_state)
-            # Expand check_state
-            for linked in check_state.get_transitions(None):
-                # Avoid potential infinite loops
-                if linked not in expanded_states:
-                    to_expand_states.add(linked)  # No need to check duplicates
-
-        set_to_complete.update(expanded_states)
+        closures = self._get_lambda_closures()
+        for st in list(set_to_complete):
+            set_to_complete.update(closures[st])
         return
 
 
@@ -101,10 +283,11 @@ class FiniteAutomaton(
         connected to it by the symbol
         Ex: A -a-> B -None-> C => _get_symbol_closure({A}, a) = {C}
         """
-        next_states = set()
+        closures = self._get_lambda_closures()
+        next_states: Set[State] = set()
         for st in init_states:
-            next_states.update(st.get_transitions(symbol))
-        self._get_lambda_closure(next_states)
+            for linked in st.get_transitions(symbol):
+                next_states.update(closures[linked])
         return next_states
 
     def _set_is_final_state(self, states: Collection[State]) -> bool:
@@ -116,46 +299,191 @@ class FiniteAutomaton(
                 return True
         return False
 
+    def _is_deterministic(self) -> bool:
+        """
+        Check if no state has lambda transitions or several targets for a symbol
+        """
+        for st in self.states:
+            for symbol, targets in st.transitions.items():
+                if symbol is None or len(targets) > 1:
+                    return False
+        return True
+
+    def compile(self, *, from_end: bool = False) -> CompiledAutomaton:
+        """
+        Compile the automaton to an integer-indexed transition table.
+
+        Nondeterministic automata are determinized first.
+
+        With ``from_end``, the minimized DFA of the reversed automaton is
+        compiled instead, and strings are read from their last symbol. This
+        suffix-matching mode rejects early the strings that fail a
+        selective ending, such as a file extension, without reading the
+        rest of them.
+
+        Args:
+            from_end: Whether to match strings from their end.
+
+        Returns:
+            Compiled automaton, ready to match strings.
+
+        """
+        if from_end:
+            return CompiledAutomaton.from_automaton(
+                self.reverse().to_minimized(),
+                from_end=True,
+            )
+
+        automaton = self if self._is_deterministic() else self.to_deterministic()
+        return CompiledAutomaton.from_automaton(automaton)
+
+    def reverse(self) -> "FiniteAutomaton":
+        """
+        Obtain an automaton that accepts the reversed strings.
+
+        Every transition is swapped, a new initial state has lambda
+        transitions to the old final states and the old initial state is
+        the only final state. Pattern ids are not kept.
+
+        Returns:
+            Automaton of the reverse language.
+
+        """
+        # Copias de los estados, con un nombre nuevo para el inicial
+        copies = {
+            st: State(st.name, is_final=st == self.initial_state)
+            for st in self.states
+        }
+        names = {st.name for st in self.states}
+        initial_name = 'rev'
+        while initial_name in names:
+            initial_name += '_'
+        initial = State(initial_name, is_final=False)
+
+        new_transitions = [
+            Transition(copies[t.final_state], t.symbol, copies[t.initial_state])
+            for t in self.transitions
+        ]
+        new_transitions.extend(
+            Transition(initial, None, copies[st])
+            for st in self.states
+            if st.is_final
+        )
+
+        new_automaton = FiniteAutomaton.from_trusted(states=[initial, *copies.values()], symbols=self.symbols, transitions=new_transitions, initial_state=initial)
+        return new_automaton
+
+
+    def _get_subset_moves(self) -> Tuple[List[State], List[int], List[Dict[str, int]]]:
+        """
+        Number the states and precompute their moves as bitmasks.
+
+        Bit ``i`` of a mask stands for the ``i``-th state of the returned list.
+        For every state, the returned moves map each symbol class
+        representative that the state actually has to the mask of the
+        lambda closure of its targets.
+
+        Returns:
+            The numbered states, the mask of the lambda closure of each
+            state and the moves of each state.
+
+        """
+        closures = self._get_lambda_closures()
+        representatives = {c[0] for c in self.symbol_classes()}
+        states: List[State] = []
+        index: Dict[State, int] = {}
+
+        def to_mask(group: Collection[State]) -> int:
+            mask = 0
+            for st in group:
+                i = index.get(st)
+                if i is None:
+                    i = index[st] = len(states)
+                    states.append(st)
+                mask |= 1 << i
+            return mask
+
+        closure_masks: List[int] = []
+        moves: List[Dict[str, int]] = []
+        to_mask(self.states)
+        # La lista puede crecer con destinos que no esten en self.states
+        for st in states:
+            closure_masks.append(to_mask(closures[st]))
+            state_moves: Dict[str, int] = {}
+            for symbol, targets in st.transitions.items():
+                if symbol in representatives:
+                    state_moves[symbol] = to_mask(
+                        {c for t in targets for c in closures[t]},
+                    )
+            moves.append(state_moves)
+
+        return states, closure_masks, moves
 
     def to_deterministic(
         self,
     ) -> "FiniteAutomaton":
 
-        # Diccionario que relaciona el nuevo estado con el estado-conj al que se refiere
-        nname = 0
-
-        # Obtener nuevo estado inicial como clausura lambda de q0
-        # Usamos frozen para que sea hasheable
-        q0_set_nonfrozen = set([self.initial_state])
-        self._get_lambda_closure(q0_set_nonfrozen)
-        q0_set = frozenset(q0_set_nonfrozen)
-
-        q0 = State(name='q'+str(nname), is_final=self._set_is_final_state(q0_set))
-        new_states_map = {q0_set: q0}
-        new_transitions = set()
-        nname += 1
+        # Los estado-conj se representan como mascaras de bits (enteros), y
+        # los movimientos de cada estado estan precalculados por simbolo
+        states, closure_masks, moves = self._get_subset_moves()
+        symbol_class = {c[0]: c for c in self.symbol_classes()}
+        final_mask = 0
+        pattern_mask = 0
+        for i, st in enumerate(states):
+            if st.is_final:
+                final_mask |= 1 << i
+                if st.patterns:
+                    pattern_mask |= 1 << i
+
+        def new_state(name: str, mask: int) -> State:
+            # Un estado-conj acepta los patrones de todos sus finales
+            state = State(name=name, is_final=bool(mask & final_mask))
+            mask &= pattern_mask
+            if mask:
+                patterns: Set[int] = set()
+                while mask:
+                    lowest = mask & -mask
+                    patterns.update(states[lowest.bit_length() - 1].patterns)
+                    mask ^= lowest
+                state.patterns = frozenset(patterns)
+            return state
+
+        # Nuevo estado inicial como clausura lambda de q0
+        q0_mask = closure_masks[states.index(self.initial_state)]
+        q0 = new_state('q0', q0_mask)
+        new_states_map = {q0_mask: q0}
+        new_transitions: List[Transition] = []
 
         # Bucle sobre los estado-conjs pendientes
-        to_expand_sets = set()
-        to_expand_sets.update([q0_set])
-
-        while len(to_expand_sets) > 0:
-            expanding_set = to_expand_sets.pop()
-            # Bucle sobre los simbolos
-            for symbol in self.symbols:
-                # Para el simbolo actual obtenemos estado-conj a los que se llega
-                qn = frozenset(self._get_symbol_closure(expanding_set, symbol))
-                if qn not in new_states_map.keys() and len(qn)>0 :
-                    # Basta ver que no estaba en el diccionario para añadirlo a to_expand_sets
-                    to_expand_sets.add(qn)
-                    new_states_map[qn] = State(name='q'+str(nname),is_final=self._set_is_final_state(qn))
-                    nname += 1
-                    # Añadir transicion desde el estado asociado a expanding_set hasta qn por simbolo
-                if len(qn)>0:
-                    new_transitions.add(Transition(initial_state=new_states_map[expanding_set], symbol=symbol, final_state=new_states_map[qn]))
+        to_expand_masks = [q0_mask]
+        while to_expand_masks:
+            expanding_mask = to_expand_masks.pop()
+            expanding_state = new_states_map[expanding_mask]
+
+            # En una sola pasada por los estados del conjunto agrupamos sus
+            # movimientos por simbolo; los simbolos sin transiciones no aparecen
+            grouped: Dict[str, int] = {}
+            mask = expanding_mask
+            while mask:
+                lowest = mask & -mask
+                for symbol, target in moves[lowest.bit_length() - 1].items():
+                    grouped[symbol] = grouped.get(symbol, 0) | target
+                mask ^= lowest
+
+            for representative, qn_mask in grouped.items():
+                qn = new_states_map.get(qn_mask)
+                if qn is None:
+                    # Basta ver que no estaba en el diccionario para expandirlo
+                    qn = new_state('q'+str(len(new_states_map)), qn_mask)
+                    new_states_map[qn_mask] = qn
+                    to_expand_masks.append(qn_mask)
+                # Añadir transicion desde el estado asociado a expanding_mask
+                # hasta qn por cada simbolo de la clase
+                for symbol in symbol_class[representative]:
+                    new_transitions.append(Transition(initial_state=expanding_state, symbol=symbol, final_state=qn))
 
         # Crear nuevo automata
-        new_automaton = FiniteAutomaton(states=set(new_states_map.values()),symbols=self.symbols,transitions=new_transitions,initial_state=q0)
+        new_automaton = FiniteAutomaton.from_trusted(states=new_states_map.values(),symbols=self.symbols,transitions=new_transitions,initial_state=q0)
         return new_automaton
 
 
@@ -163,149 +491,210 @@ class FiniteAutomaton(
         self,
     ) -> "FiniteAutomaton":
 
-        # Inicializar nuevo automata
+        # Trabajamos sobre un automata determinista
+        if not self._is_deterministic():
+            return self.to_deterministic().to_minimized()
+
+        # Numeramos los estados accesibles desde el inicial (BFS), guardando
+        # solo las transiciones que existen: delta[q] = {simbolo: destino}.
+        # Basta con un simbolo representante por clase de simbolos
+        symbol_class = {c[0]: c for c in self.symbol_classes()}
+        reachable = [self.initial_state]
+        state_index = {self.initial_state: 0}
+        delta: List[Dict[str, int]] = []
+        for st in reachable:
+            row = {}
+            for sym, targets in st.transitions.items():
+                if sym not in symbol_class:
+                    continue
+                for target in targets:
+                    if target not in state_index:
+                        state_index[target] = len(reachable)
+                        reachable.append(target)
+                    row[sym] = state_index[target]
+            delta.append(row)
+
+        # Si el automata es parcial el resultado tambien lo sera, asi que
+        # descartamos los estados desde los que no se llega a ningun final.
+        # Un automata completo se mantiene completo (con su estado sumidero)
+        is_complete = all(len(row) == len(symbol_class) for row in delta)
+        predecessors: List[List[int]] = [[] for _ in reachable]
+        for p, row in enumerate(delta):
+            for q in row.values():
+                predecessors[q].append(p)
+        useful = [is_complete or st.is_final for st in reachable]
+        to_visit = [q for q, is_useful in enumerate(useful) if is_useful]
+        while to_visit:
+            q = to_visit.pop()
+            for p in predecessors[q]:
+                if not useful[p]:
+                    useful[p] = True
+                    to_visit.append(p)
+
+        if not useful[0]:
+            # Lenguaje vacio: basta con el estado inicial sin transiciones
+            q0 = State('0', is_final=False)
+            return FiniteAutomaton.from_trusted(states=[q0], symbols=self.symbols, transitions=[], initial_state=q0)
+
+        kept = [q for q in range(len(reachable)) if useful[q]]
+        renumber = {q: i for i, q in enumerate(kept)}
+        delta = [
+            {sym: renumber[t] for sym, t in delta[q].items() if useful[t]}
+            for q in kept
+        ]
+        finals = [reachable[q].is_final for q in kept]
+
+        # Los estados con distintos patrones nunca son equivalentes
+        block_of = _hopcroft_partition(
+            delta,
+            [(finals[i], reachable[q].patterns) for i, q in enumerate(kept)],
+        )
 
-        # Crear lista de equivalencia Q/E0 segun equivalencia por cadenas de longitud 0
+        # Un estado nuevo por clase, numerados en el orden en que aparecen
+        # desde el inicial, con las transiciones de un representante
+        representative: Dict[int, int] = {}
+        for q in range(len(kept)):
+            representative.setdefault(block_of[q], q)
 
-        # Bucle hasta que Q/Ei+1 = Q/Ei
+        new_states: Dict[int, State] = {}
+        for i, (block, q) in enumerate(representative.items()):
+            new_states[block] = State(str(i), is_final=finals[q])
+            new_states[block].patterns = reachable[kept[q]].patterns
 
-        def get_state_by_name(states: Collection[State], name: str) -> Optional[State]:
-            """
-            """
-            for st in states:
-                if st.name == name:
-                    return st
-            return None
+        new_transitions = []
+        for block, new_state in new_states.items():
+            for sym, target_index in delta[representative[block]].items():
+                for class_sym in symbol_class[sym]:
+                    new_transitions.append(Transition(new_state, class_sym, new_states[block_of[target_index]]))
 
-        def get_class_list(d: Dict[State, int], clase: int) -> Collection[State]:
-            """
-            """
-            states = []
-            for st in d.keys():
-                if d[st] == clase:
-                    states.append(st)
-            return states
-
-        def compare_state_transition_classes(d: Dict[State, int], s1: State, s2: State) -> bool:
-            """
-            """
-            # First we generate the list for the elements that are from the same class as s1
-
-            for smb in self.symbols:
-                # tr are sets of states
-                tr1 = s1.get_transitions(smb)
-                tr2 = s2.get_transitions(smb)
-                for st1 in tr1:
-                    for st2 in tr2:
-                        if d[st1] != d[st2]:
-                            return False
-            return True
-
-
-        # Vamos a eliminar estado innaccesibles del automata
-
-        # Lo primero que hacemos es generar el set de estados inaccesibles, ahora debemos eliminarlos del automata
-        accesible_aux = [self.initial_state]
-        #accesible_aux.add(self.initial_state)
-        marked = set()
-
-        while len(accesible_aux) > 0 :
-            st = accesible_aux.pop()
-            for sym in st.transitions.keys():
-                aux = st.transitions[sym].pop()
-                st.transitions[sym].add(aux)
-                if aux not in marked:
-                    accesible_aux.append(aux)
-            marked.add(st)
-
-
-        # Los eliminamos del automata
-        self.states = marked
-
-        #Tambien eliminamos todas las transiciones que tienen este, como estado inicial
-        transitions_aux = list(self.transitions)
-        for tr in self.transitions:
-            if tr.initial_state not in self.states or tr.final_state not in self.states:
-                transitions_aux.remove(tr)
-        self.transitions = transitions_aux
-
-        # Dada la lista de clases Q/Ei, para obtener Q/Ei+1:
-        # 1) Hallar inicio de clase
-        # 2) Por cada elemento de la misma clase, se comprueba con cada simbolo
-        #    de alfabeto que la transicion lleva a un estado de la misma clase
-        #    en Q/Ei
-        # 3) Si no, no sigue en la misma clase. En otro caso, se mantiene la clase
-        # 4) Repetir para todos los estados de la misma clase partiendo del inicial
-
-        
-        Q_0 = dict()
-        Q_1 = dict()
-
-        # Inicializamos Q0 segun si los estados son finales (1) iniciales (0)
-        for st in self.states:
-            if st.is_final:
-                Q_0[st] = 1
-            else:
-                Q_0[st] = 0
-
-        clases = list(set(Q_0.values()))
-        while Q_0 != Q_1:
-            Q_1 = dict()
-            unclassed = list(Q_0.keys())
-            # Identificar inicio de clase
-            # Marcar estados que mantienen clases
-            for cl in clases:
-                class_list = get_class_list(Q_0, cl)
-                for st in class_list:
-                    if compare_state_transition_classes(Q_0, class_list[0], st):
-                        Q_1[st] = cl
-                        unclassed.remove(st)
-            # Para los estados que cambian de clase:
-            while len(unclassed) > 0:
-                # Crear nueva clase
-                clases.append(clases[-1]+1)
-                max_clase = clases[-1]
-                repr = unclassed.pop(0)
-                Q_1[repr] = max_clase
-                # Comprobar para los que quedan sin clase
-                for st in unclassed[:]:
-                    if Q_0[st] == Q_0[repr]:
-                        if compare_state_transition_classes(Q_0, st, repr):
-                            Q_1[st] = max_clase
-                            unclassed.remove(st)
-            Q_0, Q_1 = Q_1, Q_0
-            # Para los que no pertenecen a una clase ya existente, vamos creando nuevas
-            # Observacion: seguro que no pertenecen a otra clase distinta ya existente
-        
-        final_initial_state = None
-        init_cl = Q_0[self.initial_state]
-
-        # Creamos conjunto nuevo de estados
-        final_states = set()
-        for cl in clases:
-            states = get_class_list(Q_0, cl)
-            repres = states[0]
-            new_state = State(str(cl), is_final=repres.is_final)
-            final_states.add(new_state)
-            if cl == init_cl:
-                final_initial_state = new_state
-        
-        
-        # Creamos conjunto nuevo de transiciones
-        final_transitions = set()
-        for st in final_states:
-            cl = int(st.name)
-            states = get_class_list(Q_0, cl)
-            repres = states[0]
-            for symbol in self.symbols:
-                next_sts = repres.get_transitions(symbol)
-                # Nos fijamos en uno cualquiera, ya que el automata se
-                # presupone ya determinista
-                for nst in next_sts:
-                    next_cl = Q_0[nst]
-                    break
-                final_transitions.add(Transition(st, symbol, get_state_by_name(final_states, str(next_cl))))
-
-        new_automaton = FiniteAutomaton(states=final_states, symbols=self.symbols, transitions=final_transitions, initial_state=final_initial_state)
+        new_automaton = FiniteAutomaton.from_trusted(states=new_states.values(), symbols=self.symbols, transitions=new_transitions, initial_state=new_states[block_of[0]])
         return new_automaton
 
+
+def _hopcroft_partition(
+    delta: Sequence[Mapping[str, int]],
+    labels: Sequence[Hashable],
+) -> List[int]:
+    """
+    Compute the Myhill-Nerode classes of a DFA, which may be partial.
+
+    This is Hopcroft's algorithm generalized to partial transition functions
+    as in Valmari and Lehtinen. States are kept in a refinable partition, in
+    which a block is split in time proportional to its smaller half. Every
+    initial block is used as a splitter, and after a split only the new
+    block (always the smaller half) is added, for the symbols that actually
+    enter it. The work is O(m log n) for the m existing transitions, without
+    completing the automaton with a sink state.
+
+    The initial partition groups the states with the same label, which is
+    usually whether they are final or not.
+
+    Args:
+        delta: Existing transitions of each state, ``delta[q][symbol]`` is
+            the target of ``q`` with ``symbol``.
+        labels: Label of each state. States with different labels are
+            never in the same class.
+
+    Returns:
+        Block (class) index of each state.
+
+    """
+    n_states = len(delta)
+
+    # Indices inversos: inverse[q][a] = estados que llegan a q con a
+    inverse: List[Dict[str, List[int]]] = [{} for _ in range(n_states)]
+    for p, row in enumerate(delta):
+        for sym, q in row.items():
+            inverse[q].setdefault(sym, []).append(p)
+
+    # Particion refinable: los estados de cada bloque son contiguos en elems,
+    # y los marcados de un bloque b ocupan elems[first[b]:mid[b]]
+    groups: Dict[Hashable, List[int]] = {}
+    for q, label in enumerate(labels):
+        groups.setdefault(label, []).append(q)
+
+    elems: List[int] = []
+    loc = [0] * n_states
+    block_of = [0] * n_states
+    first: List[int] = []
+    end: List[int] = []
+    mid: List[int] = []
+    for group in groups.values():
+        first.append(len(elems))
+        mid.append(len(elems))
+        for q in group:
+            loc[q] = len(elems)
+            block_of[q] = len(end)
+            elems.append(q)
+        end.append(len(elems))
+
+    touched: List[int] = []
+
+    def mark(q: int) -> None:
+        b = block_of[q]
+        i = loc[q]
+        m = mid[b]
+        if i >= m:
+            other = elems[m]
+            elems[i], elems[m] = other, q
+            loc[other], loc[q] = i, m
+            mid[b] = m + 1
+            if m == first[b]:
+                touched.append(b)
+
+    def split() -> List[int]:
+        new_blocks = []
+        for b in touched:
+            m = mid[b]
+            if m == end[b]:
+                # Todos marcados: el bloque no se divide
+                mid[b] = first[b]
+                continue
+
+            z = len(first)
+            if m - first[b] <= end[b] - m:
+                first.append(first[b])
+                end.append(m)
+                first[b] = m
+            else:
+                first.append(m)
+                end.append(end[b])
+                end[b] = m
+            mid.append(first[z])
+            mid[b] = first[b]
+            for i in range(first[z], end[z]):
+                block_of[elems[i]] = z
+            new_blocks.append(z)
+
+        touched.clear()
+        return new_blocks
+
+    pending: List[Tuple[int, str]] = []
+    in_pending: Set[Tuple[int, str]] = set()
+
+    def add_splitters(b: int) -> None:
+        entering: Set[str] = set()
+        for i in range(first[b], end[b]):
+            entering.update(inverse[elems[i]])
+        for sym in entering:
+            if (b, sym) not in in_pending:
+                pending.append((b, sym))
+                in_pending.add((b, sym))
+
+    for b in range(len(first)):
+        add_splitters(b)
+
+    while pending:
+        splitter = pending.pop()
+        in_pending.discard(splitter)
+        b, sym = splitter
+
+        # Marcamos los predecesores con sym de los estados del bloque b
+        for q in elems[first[b]:end[b]]:
+            for p in inverse[q].get(sym, ()):
+                mark(p)
+
+        for z in split():
+            add_splitters(z)
+
+    return block_of
@@ -1,5 +1,6 @@
 """Evaluation of automata."""
-from typing import Set
+from collections import OrderedDict
+from typing import AbstractSet, Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
 
 from automata.automaton import FiniteAutomaton, State
 from automata.interfaces import AbstractFiniteAutomatonEvaluator
@@ -22,12 +23,11 @@ class FiniteAutomatonEvaluator(
         if symbol not in self.automaton.symbols:
             raise ValueError
 
-        new_current_states = set()
-        for s in self.current_states:
-            new_current_states.update(s.get_transitions(symbol))
-
-        self._complete_lambdas(new_current_states)
-        self.current_states = new_current_states
+        # La clausura por simbolo ya incluye las lambdas posteriores
+        self.current_states = self.automaton._get_symbol_closure(
+            self.current_states,
+            symbol,
+        )
         return
 
     def _complete_lambdas(self, set_to_complete: Set[State]) -> None:
@@ -36,22 +36,8 @@ class FiniteAutomatonEvaluator(
         todos los estados que sean alcanzables mediante un número arbitrario de
         transiciones lambda
         """
-        # Auxiliary set of already expanded states and expected to expand
-        expanded_states = set()
-        to_expand_states = set()
-        to_expand_states.update(set_to_complete)
-
-        while len(to_expand_states) > 0:
-            # Completing lambdas doesnt need an specific order (random with pop)
-            check_state = to_expand_states.pop()
-            expanded_states.add(check_state)
-            # Expand check_state
-            for linked in check_state.get_transitions(None):
-                # Avoid potential infinite loops
-                if linked not in expanded_states:
-                    to_expand_states.add(linked)  # No need to check duplicates
-
-        set_to_complete.update(expanded_states)
+        # Las clausuras se calculan una sola vez en el automata
+        self.automaton._get_lambda_closure(set_to_complete)
         return
 
     def is_accepting(self) -> bool:
@@ -63,3 +49,235 @@ class FiniteAutomatonEvaluator(
             if s.is_final:
                 return True
         return False
+
+
+class BitsetFiniteAutomatonEvaluator(
+    AbstractFiniteAutomatonEvaluator[FiniteAutomaton, State],
+):
+    """
+    Evaluator of an automaton that keeps the current states as a bitmask.
+
+    Bit ``i`` of ``current_mask`` is set when ``states[i]`` is one of the
+    current states. The successors of every state for every symbol are
+    precomputed with their lambda closure already included, so processing a
+    symbol only ORs together the masks of the states that are set. Symbols
+    of the same class (see ``FiniteAutomaton.symbol_classes``) share their
+    successor masks.
+
+    Args:
+        automaton: Automaton to evaluate.
+
+    """
+
+    states: Sequence[State]
+    current_mask: int
+
+    def __init__(self, automaton: FiniteAutomaton) -> None:
+        self.states = tuple(automaton.states)
+        self._state_index: Dict[State, int] = {
+            s: i for i, s in enumerate(self.states)
+        }
+
+        # Mascara de la clausura lambda de cada estado
+        closures = automaton._get_lambda_closures()
+        self._closures: List[int] = [
+            self._to_mask(closures[st]) for st in self.states
+        ]
+
+        # Mascara de sucesores (con clausura) por simbolo y estado; los
+        # simbolos de una misma clase comparten la lista
+        self._successors: Dict[str, List[int]] = {}
+        for symbol_class in automaton.symbol_classes():
+            successors = []
+            for st in self.states:
+                mask = 0
+                for linked in st.get_transitions(symbol_class[0]):
+                    mask |= self._closures[self._state_index[linked]]
+                successors.append(mask)
+            for symbol in symbol_class:
+                self._successors[symbol] = successors
+
+        self._final_mask = self._to_mask(s for s in self.states if s.is_final)
+        self.current_mask = 0
+        super().__init__(automaton)
+
+    def _to_mask(self, states: Iterable[State]) -> int:
+        """
+        Obtain the bitmask of a collection of states.
+        """
+        mask = 0
+        for st in states:
+            mask |= 1 << self._state_index[st]
+        return mask
+
+    @property
+    def current_states(self) -> AbstractSet[State]:  # type: ignore[override]
+        """Set of current states, decoded from ``current_mask``."""
+        return frozenset(
+            st for i, st in enumerate(self.states)
+            if self.current_mask >> i & 1
+        )
+
+    @current_states.setter
+    def current_states(self, states: AbstractSet[State]) -> None:
+        self.current_mask = self._to_mask(states)
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Procesa un símbolo de la cadena haciendo la OR de las mascaras de
+        sucesores de los estados actuales (que ya incluyen las lambdas)
+        """
+        successors = self._successors.get(symbol)
+        if successors is None:
+            raise ValueError
+
+        mask = self.current_mask
+        new_mask = 0
+        while mask:
+            lowest = mask & -mask
+            new_mask |= successors[lowest.bit_length() - 1]
+            mask ^= lowest
+
+        self.current_mask = new_mask
+
+    def _complete_lambdas(self, set_to_complete: Set[State]) -> None:
+        """
+        Añade al conjunto los estados alcanzables mediante transiciones lambda
+        usando las mascaras de clausura precalculadas
+        """
+        closure = 0
+        for st in set_to_complete:
+            closure |= self._closures[self._state_index[st]]
+        set_to_complete.update(
+            st for i, st in enumerate(self.states) if closure >> i & 1
+        )
+
+    def is_accepting(self) -> bool:
+        """
+        Indica si alguno de los estados actuales es final.
+        """
+        return bool(self.current_mask & self._final_mask)
+
+    def is_dead(self) -> bool:
+        """
+        Indica si no queda ningun estado actual.
+        """
+        return not self.current_mask
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted without changing state.
+
+        Only the bitmask is saved and restored, without decoding it.
+
+        Note: This function is NOT thread-safe.
+
+        """
+        old_mask = self.current_mask
+        try:
+            self.process_string(string)
+            accepted = self.is_accepting()
+        finally:
+            self.current_mask = old_mask
+
+        return accepted
+
+    def matching_patterns(self) -> FrozenSet[int]:
+        """
+        Obtiene los patrones de los estados finales actuales.
+        """
+        patterns: Set[int] = set()
+        mask = self.current_mask & self._final_mask
+        while mask:
+            lowest = mask & -mask
+            patterns.update(self.states[lowest.bit_length() - 1].patterns)
+            mask ^= lowest
+        return frozenset(patterns)
+
+    def match(self, string: str) -> FrozenSet[int]:
+        """
+        Return the ids of the patterns that accept a string.
+
+        Only the bitmask is saved and restored, without decoding it.
+
+        Note: This function is NOT thread-safe.
+
+        """
+        old_mask = self.current_mask
+        try:
+            self.process_string(string)
+            patterns = self.matching_patterns()
+        finally:
+            self.current_mask = old_mask
+
+        return patterns
+
+
+class LazyDeterministicEvaluator(
+    AbstractFiniteAutomatonEvaluator[FiniteAutomaton, State],
+):
+    """
+    Evaluator that determinizes the automaton on the fly.
+
+    The current states are always a frozenset, that is, a state of the
+    equivalent deterministic automaton. The transitions between these
+    subsets are computed with ``_get_symbol_closure`` only when the input
+    reaches them, and are kept in a bounded LRU cache, so memory stays
+    predictable even when the full determinization would blow up.
+
+    Args:
+        automaton: Automaton to evaluate.
+        max_cache_size: Maximum number of cached subset transitions.
+
+    """
+
+    current_states: FrozenSet[State]
+    max_cache_size: int
+
+    def __init__(
+        self,
+        automaton: FiniteAutomaton,
+        max_cache_size: int = 10000,
+    ) -> None:
+        super().__init__(automaton)
+        self.current_states = frozenset(self.current_states)
+        self.max_cache_size = max_cache_size
+        self._symbols = frozenset(automaton.symbols)
+        self._cache: "OrderedDict[Tuple[FrozenSet[State], str], FrozenSet[State]]" = (
+            OrderedDict()
+        )
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Procesa un símbolo de la cadena usando la transicion entre conjuntos
+        de la cache, o calculandola y guardandola si no estaba
+        """
+        if symbol not in self._symbols:
+            raise ValueError
+
+        key = (self.current_states, symbol)
+        next_states = self._cache.get(key)
+        if next_states is None:
+            next_states = frozenset(
+                self.automaton._get_symbol_closure(self.current_states, symbol),
+            )
+            self._cache[key] = next_states
+            # Si nos pasamos del presupuesto se descarta la menos usada
+            if len(self._cache) > self.max_cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+
+        self.current_states = next_states
+
+    def _complete_lambdas(self, set_to_complete: Set[State]) -> None:
+        """
+        Añade al conjunto los estados alcanzables mediante transiciones lambda
+        """
+        self.automaton._get_lambda_closure(set_to_complete)
+
+    def is_accepting(self) -> bool:
+        """
+        Indica si el conjunto de estados actual contiene algun estado final.
+        """
+        return self.automaton._set_is_final_state(self.current_states)
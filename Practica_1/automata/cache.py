@@ -0,0 +1,198 @@
+"""Cache of the automata built from regexes."""
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.glushkov import GlushkovParser
+from automata.re_parser import REParser
+
+# Se cambia si cambia el formato de los ficheros o la construccion
+_FORMAT_VERSION = 1
+
+_CONSTRUCTIONS: Dict[str, Callable[[], Any]] = {
+    "thompson": REParser,
+    "glushkov": GlushkovParser,
+}
+_STAGES = ("nfa", "deterministic", "minimized")
+
+_Key = Tuple[str, str, str]
+
+
+def _to_json(automaton: FiniteAutomaton) -> Dict[str, Any]:
+    """Serialize an automaton to a JSON compatible dictionary."""
+    return {
+        "version": _FORMAT_VERSION,
+        "symbols": sorted(automaton.symbols),
+        "initial": automaton.initial_state.name,
+        "states": [[s.name, s.is_final] for s in automaton.states],
+        "transitions": [
+            [t.initial_state.name, t.symbol, t.final_state.name]
+            for t in automaton.transitions
+        ],
+    }
+
+
+def _from_json(data: Dict[str, Any]) -> FiniteAutomaton:
+    """Deserialize an automaton, validating it as it may be corrupted."""
+    if not isinstance(data, dict):
+        raise ValueError("The file does not contain an automaton")
+    if data.get("version") != _FORMAT_VERSION:
+        raise ValueError("Unsupported format version")
+
+    states = {name: State(name, is_final=bool(final)) for name, final in data["states"]}
+    return FiniteAutomaton(
+        initial_state=states[data["initial"]],
+        states=list(states.values()),
+        symbols=data["symbols"],
+        transitions=[
+            Transition(states[origin], symbol, states[target])
+            for origin, symbol, target in data["transitions"]
+        ],
+    )
+
+
+class AutomatonCache():
+    """
+    Cache of the automata built from regexes.
+
+    Automata are kept in memory, keyed by the regex and the construction
+    options, and the least recently used one is discarded when there are
+    more than ``max_size``. Optionally, minimized automata are also stored
+    on disk, one JSON file per regex named by the SHA-256 hash of the key,
+    so that they survive restarts. Files are written atomically, and a
+    corrupted or outdated file is simply built again.
+
+    Cached automata are shared, so they must not be modified.
+
+    Args:
+        max_size: Maximum number of automata kept in memory.
+        directory: Directory of the disk store. By default, there is no
+            disk store.
+
+    """
+
+    max_size: int
+    directory: Optional[str]
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        directory: Optional[str] = None,
+    ) -> None:
+        self.max_size = max_size
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[_Key, FiniteAutomaton]" = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(
+        self,
+        re_string: str,
+        *,
+        stage: str = "minimized",
+        construction: str = "thompson",
+    ) -> FiniteAutomaton:
+        """
+        Obtain the automaton of a regex, building it only if needed.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+            stage: ``"nfa"`` for the automaton of the construction,
+                ``"deterministic"`` or ``"minimized"``.
+            construction: ``"thompson"`` (``REParser``) or ``"glushkov"``
+                (``GlushkovParser``).
+
+        Returns:
+            The automaton, shared with the other users of the cache.
+
+        Raises:
+            ValueError: If the stage or the construction are not known.
+
+        """
+        if stage not in _STAGES:
+            raise ValueError(f"Unknown stage {stage!r}")
+        if construction not in _CONSTRUCTIONS:
+            raise ValueError(f"Unknown construction {construction!r}")
+
+        key = (re_string, stage, construction)
+        automaton = self._cache.get(key)
+        if automaton is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return automaton
+
+        self.misses += 1
+        automaton = self._load(key)
+        if automaton is None:
+            automaton = self._build(key)
+            self._store(key, automaton)
+
+        self._cache[key] = automaton
+        # Si nos pasamos del tamaño se descarta el menos usado
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+        return automaton
+
+    def clear(self) -> None:
+        """Empty the memory cache. The disk store is kept."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _build(self, key: _Key) -> FiniteAutomaton:
+        re_string, stage, construction = key
+        automaton = _CONSTRUCTIONS[construction]().create_automaton(re_string)
+        if stage == "deterministic":
+            automaton = automaton.to_deterministic()
+        elif stage == "minimized":
+            automaton = automaton.to_minimized()
+        return automaton
+
+    def _path(self, key: _Key) -> Optional[str]:
+        """Path of the file of a key, only for minimized automata."""
+        if self.directory is None or key[1] != "minimized":
+            return None
+
+        digest = hashlib.sha256(
+            json.dumps([_FORMAT_VERSION, *key]).encode("utf-8"),
+        ).hexdigest()
+        return os.path.join(self.directory, digest + ".json")
+
+    def _load(self, key: _Key) -> Optional[FiniteAutomaton]:
+        path = self._path(key)
+        if path is None:
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                return _from_json(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            # No existe o esta corrupto: se vuelve a construir
+            return None
+
+    def _store(self, key: _Key, automaton: FiniteAutomaton) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+
+        # Escritura atomica: fichero temporal en el mismo directorio y
+        # renombrado, para que nadie lea un fichero a medias
+        assert self.directory is not None
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(_to_json(automaton), f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,439 @@
+"""Compiled integer-indexed representation of deterministic automata."""
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from automata.interfaces import AbstractFiniteAutomaton
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for batch matching
+    np = None  # type: ignore[assignment]
+
+
+class CompiledAutomaton():
+    """
+    Deterministic automaton compiled to a flat transition table.
+
+    States are mapped to dense integers, and symbols to the dense integer of
+    their class: symbols with the same targets from every state share a
+    class, and so a column of the table. The transition function is stored
+    row-major in an ``array('i')``, so the target of state ``q`` with a
+    symbol of class ``c`` is ``table[q * n_columns + c]``. Missing
+    transitions are stored as ``-1`` and behave as a dead state.
+
+    Compiled automata are immutable and matching keeps no state in the
+    object, so a single instance can be shared by many threads.
+
+    Args:
+        symbols: Symbols of the automaton.
+        table: Flat transition table. It is copied to an ``array('i')``.
+        finals: For each state index, ``1`` if it is final, ``0`` otherwise.
+        initial: Index of the initial state.
+        classes: Column (class) of each symbol, in the order of
+            ``symbols``. By default, each symbol has its own column.
+        patterns: Ids of the patterns accepted in each state. By default,
+            no state has pattern ids.
+        from_end: Whether strings are read from their last symbol, for
+            automata of the reversed language.
+
+    """
+
+    __slots__ = (
+        "symbols",
+        "symbol_index",
+        "n_columns",
+        "table",
+        "finals",
+        "initial",
+        "patterns",
+        "from_end",
+        "_batch_tables",
+    )
+
+    symbols: Sequence[str]
+    symbol_index: Dict[str, int]
+    n_columns: int
+    table: "array[int]"
+    finals: bytes
+    initial: int
+    patterns: Tuple[FrozenSet[int], ...]
+    from_end: bool
+    _batch_tables: Optional[Tuple[Any, Any, Any]]
+
+    def __init__(
+        self,
+        *,
+        symbols: Sequence[str],
+        table: Iterable[int],
+        finals: bytes,
+        initial: int,
+        classes: Optional[Sequence[int]] = None,
+        patterns: Optional[Sequence[FrozenSet[int]]] = None,
+        from_end: bool = False,
+    ) -> None:
+        symbols = tuple(symbols)
+        if classes is None:
+            classes = range(len(symbols))
+        object.__setattr__(self, "symbols", symbols)
+        object.__setattr__(self, "symbol_index", dict(zip(symbols, classes)))
+        object.__setattr__(self, "n_columns", max(classes, default=-1) + 1)
+        object.__setattr__(self, "table", array("i", table))
+        object.__setattr__(self, "finals", bytes(finals))
+        object.__setattr__(self, "initial", initial)
+        object.__setattr__(
+            self,
+            "patterns",
+            (frozenset(),) * len(finals) if patterns is None else tuple(patterns),
+        )
+        object.__setattr__(self, "from_end", from_end)
+        # Tablas de accepts_many, creadas la primera vez que se usan
+        object.__setattr__(self, "_batch_tables", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            _rebuild_compiled_automaton,
+            (
+                self.symbols,
+                self.table,
+                self.finals,
+                self.initial,
+                [self.symbol_index[s] for s in self.symbols],
+                self.patterns,
+                self.from_end,
+            ),
+        )
+
+    @classmethod
+    def from_automaton(
+        cls,
+        automaton: AbstractFiniteAutomaton,
+        *,
+        from_end: bool = False,
+    ) -> "CompiledAutomaton":
+        """
+        Compile a deterministic automaton.
+
+        Args:
+            automaton: Deterministic automaton to compile.
+            from_end: Whether strings are read from their last symbol.
+
+        Returns:
+            Compiled automaton.
+
+        Raises:
+            ValueError: If the automaton is not deterministic.
+
+        """
+        states = [automaton.initial_state]
+        states.extend(s for s in automaton.states if s != automaton.initial_state)
+        state_index = {s: i for i, s in enumerate(states)}
+
+        # Firma de cada simbolo: los pares (origen, destino) que lo usan
+        signatures: Dict[str, List[Tuple[int, int]]] = {
+            s: [] for s in automaton.symbols
+        }
+        seen: Set[Tuple[int, str]] = set()
+        for t in automaton.transitions:
+            if t.symbol is None:
+                raise ValueError("Automaton is not deterministic")
+
+            origin = state_index[t.initial_state]
+            if (origin, t.symbol) in seen:
+                raise ValueError("Automaton is not deterministic")
+
+            seen.add((origin, t.symbol))
+            signatures[t.symbol].append((origin, state_index[t.final_state]))
+
+        # Una columna por clase de simbolos con la misma firma
+        columns: Dict[FrozenSet[Tuple[int, int]], int] = {}
+        classes = [
+            columns.setdefault(frozenset(signature), len(columns))
+            for signature in signatures.values()
+        ]
+        n_columns = len(columns)
+
+        table = array("i", [-1]) * (len(states) * n_columns)
+        for signature, column in columns.items():
+            for origin, target in signature:
+                table[origin * n_columns + column] = target
+
+        return cls(
+            symbols=tuple(signatures),
+            table=table,
+            finals=bytes(s.is_final for s in states),
+            initial=0,
+            classes=classes,
+            patterns=tuple(s.patterns for s in states),
+            from_end=from_end,
+        )
+
+    @property
+    def n_states(self) -> int:
+        """Number of states of the compiled automaton."""
+        return len(self.finals)
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted.
+
+        Processing stops as soon as the dead state is reached, so symbols
+        after that point are not checked against the alphabet.
+
+        Args:
+            string: String to process.
+
+        Returns:
+            ``True`` if the string is accepted, ``False`` otherwise.
+
+        Raises:
+            ValueError: If a symbol is not in the alphabet of the automaton.
+
+        """
+        state = self._run(string)
+        return state >= 0 and bool(self.finals[state])
+
+    def match(self, string: str) -> FrozenSet[int]:
+        """
+        Return the ids of the patterns that accept a string.
+
+        The string is processed once, whatever the number of patterns. See
+        ``REParser.create_multi_automaton``.
+
+        Args:
+            string: String to process.
+
+        Returns:
+            Ids of the patterns of the reached state, empty if the string
+            is not accepted.
+
+        Raises:
+            ValueError: If a symbol is not in the alphabet of the automaton.
+
+        """
+        state = self._run(string)
+        return self.patterns[state] if state >= 0 else frozenset()
+
+    def _run(self, string: str) -> int:
+        """Return the state reached with a string, or -1 if it dies."""
+        table = self.table
+        symbol_index = self.symbol_index
+        n_columns = self.n_columns
+
+        state = self.initial
+        for symbol in reversed(string) if self.from_end else string:
+            index = symbol_index.get(symbol)
+            if index is None:
+                raise ValueError(f"Symbol {symbol!r} is not in the alphabet")
+
+            state = table[state * n_columns + index]
+            if state < 0:
+                return state
+
+        return state
+
+    def accepts_many(self, strings: Sequence[str]) -> Sequence[bool]:
+        """
+        Return if each string of a batch is accepted.
+
+        With NumPy available, the batch is encoded as a padded matrix of
+        symbol indices and the states of all the strings advance at once,
+        one column per step, with fancy indexing into the transition table.
+        A padding column leaves every state unchanged and missing
+        transitions go to an explicit dead state. These tables are built on
+        the first call and kept in the compiled automaton. Without NumPy the
+        strings are matched one by one.
+
+        Unlike ``accepts``, every symbol of the batch is checked against the
+        alphabet, even after a string has reached the dead state.
+
+        Args:
+            strings: Strings to process.
+
+        Returns:
+            Boolean NumPy array (a list of bools if NumPy is not installed)
+            with ``True`` in the positions of the accepted strings.
+
+        Raises:
+            ValueError: If a symbol is not in the alphabet of the automaton.
+
+        """
+        if np is None:
+            return [self.accepts(string) for string in strings]
+
+        table, finals, lookup = self._get_batch_tables()
+        padding = self.n_columns
+        max_code = len(lookup) - 1
+
+        if self.from_end:
+            strings = [string[::-1] for string in strings]
+
+        codepoints = np.frombuffer(
+            "".join(strings).encode("utf-32-le"),
+            dtype="<u4",
+        )
+        columns = lookup[np.minimum(codepoints, max_code)]
+        invalid = columns < 0
+        if invalid.any():
+            symbol = chr(codepoints[np.argmax(invalid)])
+            raise ValueError(f"Symbol {symbol!r} is not in the alphabet")
+
+        # Matriz de cadenas con relleno, una columna contigua por paso
+        lengths = np.fromiter(
+            (len(string) for string in strings),
+            dtype=np.intp,
+            count=len(strings),
+        )
+        width = int(lengths.max()) if len(lengths) else 0
+        dtype = np.uint8 if padding < 256 else np.int32
+        matrix = np.full((len(lengths), width), padding, dtype=dtype, order="F")
+        matrix[np.arange(width) < lengths[:, None]] = columns
+
+        state = np.full(len(lengths), self.initial, dtype=np.int32)
+        for step in range(width):
+            state = table[state, matrix[:, step]]
+
+        return finals[state]
+
+    def _get_batch_tables(self) -> Tuple[Any, Any, Any]:
+        """
+        Obtain the NumPy tables of ``accepts_many``, built only once.
+
+        Returns:
+            The ``(n_states + 1) x (n_columns + 1)`` transition table, with
+            a dead state and a padding column, the final states, and the
+            column of each codepoint, ``-1`` for the codepoints that are
+            not symbols. The last entry of the lookup stands for every
+            codepoint above the alphabet.
+
+        """
+        if self._batch_tables is not None:
+            return self._batch_tables
+
+        n_states = self.n_states
+        n_columns = self.n_columns
+        dead = n_states
+        padding = n_columns
+
+        # Tabla (n_states + 1) x (n_columns + 1) con estado muerto y relleno
+        table = np.empty((n_states + 1, n_columns + 1), dtype=np.int32)
+        table[:n_states, :n_columns] = np.asarray(
+            self.table,
+            dtype=np.int32,
+        ).reshape(n_states, n_columns)
+        table[table < 0] = dead
+        table[dead, :] = dead
+        table[:, padding] = np.arange(n_states + 1, dtype=np.int32)
+
+        finals = np.zeros(n_states + 1, dtype=bool)
+        finals[:n_states] = np.frombuffer(self.finals, dtype=np.uint8) != 0
+
+        # Traduccion de codepoints a columnas; los que no son simbolos a -1
+        max_code = max((ord(s) for s in self.symbols), default=0) + 1
+        lookup = np.full(max_code + 1, -1, dtype=np.int32)
+        for symbol, index in self.symbol_index.items():
+            lookup[ord(symbol)] = index
+
+        batch_tables = (table, finals, lookup)
+        object.__setattr__(self, "_batch_tables", batch_tables)
+        return batch_tables
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"n_states={self.n_states!r}, "
+            f"symbols={self.symbols!r})"
+        )
+
+
+def _rebuild_compiled_automaton(
+    symbols: Sequence[str],
+    table: "array[int]",
+    finals: bytes,
+    initial: int,
+    classes: Sequence[int],
+    patterns: Sequence[FrozenSet[int]],
+    from_end: bool,
+) -> CompiledAutomaton:
+    """Unpickle a compiled automaton."""
+    return CompiledAutomaton(
+        symbols=symbols,
+        table=table,
+        finals=finals,
+        initial=initial,
+        classes=classes,
+        patterns=patterns,
+        from_end=from_end,
+    )
+
+
+# Automata compiled in each worker process of match_parallel
+_worker_automaton: Optional[CompiledAutomaton] = None
+
+
+def _init_worker(automaton: CompiledAutomaton) -> None:
+    """Keep the automaton shipped to this worker process."""
+    global _worker_automaton
+    _worker_automaton = automaton
+
+
+def _match_chunk(strings: List[str]) -> List[bool]:
+    """Match a chunk of strings in a worker process."""
+    assert _worker_automaton is not None
+    return [bool(accepted) for accepted in _worker_automaton.accepts_many(strings)]
+
+
+def match_parallel(
+    automaton: CompiledAutomaton,
+    strings: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = 10000,
+) -> Iterator[bool]:
+    """
+    Match a large batch of strings in a pool of worker processes.
+
+    The compiled automaton is sent once to each worker when it starts, and
+    then only chunks of strings travel between processes. At most a couple
+    of chunks per worker are in flight, so the input can be an arbitrarily
+    long iterator. Results are yielded in the order of the input.
+
+    Args:
+        automaton: Compiled automaton to match with.
+        strings: Strings to match.
+        workers: Number of worker processes. By default, one per CPU.
+        chunk_size: Number of strings sent to a worker at once.
+
+    Returns:
+        Iterator with ``True`` for every accepted string and ``False``
+        otherwise.
+
+    """
+    max_workers = workers or os.cpu_count() or 1
+    iterator = iter(strings)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(automaton,),
+    ) as executor:
+        pending: Deque["Future[List[bool]]"] = deque()
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+
+            pending.append(executor.submit(_match_chunk, chunk))
+            if len(pending) > 2 * max_workers:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,188 @@
+"""Regex matching with Brzozowski derivatives."""
+from typing import Dict, FrozenSet, List, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.re_ast import (
+    Concat,
+    Empty,
+    Lambda,
+    Regex,
+    Star,
+    Symbol,
+    Union,
+    concat,
+    parse,
+    symbols_of,
+    union,
+)
+
+
+def derivative(node: Regex, symbol: str) -> Regex:
+    """
+    Obtain the derivative of a regex with respect to a symbol.
+
+    The derivative accepts the strings ``w`` such that ``symbol`` followed
+    by ``w`` is accepted by ``node``. Derivatives are normalized with the
+    smart constructors of ``automata.re_ast`` and kept in the node, so each
+    one is computed only once. The tree is walked without recursion, so long
+    chains of nullable factors are supported.
+
+    Args:
+        node: Regex to derive.
+        symbol: Symbol to derive with.
+
+    Returns:
+        The derivative.
+
+    """
+    result = node.derivatives.get(symbol)
+    if result is not None:
+        return result
+
+    # Recorrido en postorden sin recursion: un nodo se deriva cuando ya
+    # estan las derivadas de los hijos que necesita
+    stack = [node]
+    while stack:
+        current = stack[-1]
+        if symbol in current.derivatives:
+            stack.pop()
+            continue
+
+        pending = [
+            child for child in _needed_children(current)
+            if symbol not in child.derivatives
+        ]
+        if pending:
+            stack.extend(pending)
+            continue
+
+        stack.pop()
+        current.derivatives[symbol] = _combine(current, symbol)
+
+    return node.derivatives[symbol]
+
+
+def _needed_children(node: Regex) -> Tuple[Regex, ...]:
+    """Children whose derivatives are needed to derive a node."""
+    if isinstance(node, Star):
+        return (node.inner,)
+    if isinstance(node, Concat):
+        if node.left.nullable:
+            return (node.left, node.right)
+        return (node.left,)
+    if isinstance(node, Union):
+        return node.alternatives
+    return ()
+
+
+def _combine(node: Regex, symbol: str) -> Regex:
+    """Derive a node from the derivatives of its children."""
+    if isinstance(node, Symbol):
+        return Lambda() if node.symbol == symbol else Empty()
+    if isinstance(node, Star):
+        # d(r*) = d(r).r*
+        return concat(node.inner.derivatives[symbol], node)
+    if isinstance(node, Concat):
+        # d(r.s) = d(r).s + d(s) si r acepta λ
+        result = concat(node.left.derivatives[symbol], node.right)
+        if node.left.nullable:
+            result = union([result, node.right.derivatives[symbol]])
+        return result
+    if isinstance(node, Union):
+        return union(a.derivatives[symbol] for a in node.alternatives)
+    return Empty()
+
+
+class DerivativeMatcher():
+    """
+    Matcher of a regex that builds its DFA lazily with derivatives.
+
+    The states of the DFA are normalized regexes, starting with the regex
+    itself, and the transition with a symbol goes to the derivative. As
+    derivatives are memoized in the hash-consed nodes, the DFA grows only
+    with the states and transitions that the input actually uses, with no
+    NFA in between, and then runs at the speed of a dictionary lookup per
+    symbol.
+
+    Args:
+        re_string: String with the regular expression in Kleene notation.
+
+    """
+
+    regex: Regex
+    symbols: FrozenSet[str]
+
+    def __init__(self, re_string: str) -> None:
+        self.regex = parse(re_string, normalize=True)
+        self.symbols = frozenset(symbols_of(self.regex))
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted.
+
+        Processing stops as soon as the empty language is reached.
+
+        Args:
+            string: String to process.
+
+        Returns:
+            ``True`` if the string is accepted, ``False`` otherwise.
+
+        Raises:
+            ValueError: If a symbol is not in the alphabet of the regex.
+
+        """
+        node = self.regex
+        symbols = self.symbols
+        empty = Empty()
+        for symbol in string:
+            # Los nodos se comparten entre expresiones, asi que su cache de
+            # derivadas puede tener simbolos de otros alfabetos
+            if symbol not in symbols:
+                raise ValueError(f"Symbol {symbol!r} is not in the alphabet")
+
+            following = node.derivatives.get(symbol)
+            node = derivative(node, symbol) if following is None else following
+            if node is empty:
+                return False
+
+        return node.nullable
+
+    def to_automaton(self) -> FiniteAutomaton:
+        """
+        Build the whole DFA of the regex (Brzozowski's construction).
+
+        Returns:
+            Deterministic automaton, without the state of the empty
+            language.
+
+        """
+        empty = Empty()
+        initial = State("q0", is_final=self.regex.nullable)
+        states: Dict[Regex, State] = {self.regex: initial}
+        transitions: List[Transition] = []
+
+        to_expand = [self.regex]
+        while to_expand:
+            node = to_expand.pop()
+            for symbol in sorted(self.symbols):
+                following = derivative(node, symbol)
+                if following is empty:
+                    continue
+
+                if following not in states:
+                    states[following] = State(
+                        "q" + str(len(states)),
+                        is_final=following.nullable,
+                    )
+                    to_expand.append(following)
+                transitions.append(
+                    Transition(states[node], symbol, states[following]),
+                )
+
+        return FiniteAutomaton.from_trusted(
+            initial_state=initial,
+            states=states.values(),
+            symbols=self.symbols,
+            transitions=transitions,
+        )
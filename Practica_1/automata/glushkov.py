@@ -0,0 +1,133 @@
+"""Glushkov (position) automata of regular expressions."""
+from typing import List, Set
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.re_parser_interfaces import _re_to_rpn
+
+
+class _Node():
+    """
+    Nullable, first and last positions of a subexpression.
+
+    The lists of positions are reused by the parent node, as each node is
+    used only once, and positions never repeat inside a list.
+    """
+
+    __slots__ = ("nullable", "first", "last")
+
+    def __init__(
+        self,
+        nullable: bool,
+        first: List[int],
+        last: List[int],
+    ) -> None:
+        self.nullable = nullable
+        self.first = first
+        self.last = last
+
+
+def _merge(positions1: List[int], positions2: List[int]) -> List[int]:
+    """Join two disjoint lists of positions, extending the longest one."""
+    if len(positions1) < len(positions2):
+        positions1, positions2 = positions2, positions1
+    positions1.extend(positions2)
+    return positions1
+
+
+class GlushkovParser():
+    """
+    Class for building the Glushkov automaton of a regex in Kleene's syntax.
+
+    Each occurrence of a symbol in the regex is a position. The automaton
+    has one state per position plus an initial state, and no lambda
+    transitions: the initial state goes to the ``first`` positions, every
+    position to the positions that can ``follow`` it, and the final states
+    are the ``last`` positions, plus the initial state if the regex is
+    ``nullable``. Every transition into a position is labelled with its
+    symbol.
+
+    It is an alternative to ``REParser``, with the same
+    ``create_automaton`` method, whose automata need no lambda closures.
+    """
+
+    def create_automaton(
+        self,
+        re_string: str,
+    ) -> FiniteAutomaton:
+        """
+        Create an automaton from a regex.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+
+        Returns:
+            Automaton equivalent to the regex, without lambda transitions.
+
+        """
+        # La posicion 0 es el estado inicial
+        symbols: List[str] = [""]
+        follow: List[Set[int]] = [set()]
+
+        stack: List[_Node] = []
+        for x in _re_to_rpn(re_string) if re_string else "":
+            if x == "*":
+                node = stack.pop()
+                for p in node.last:
+                    follow[p].update(node.first)
+                stack.append(_Node(True, node.first, node.last))
+            elif x == "+":
+                node2 = stack.pop()
+                node1 = stack.pop()
+                stack.append(_Node(
+                    node1.nullable or node2.nullable,
+                    _merge(node1.first, node2.first),
+                    _merge(node1.last, node2.last),
+                ))
+            elif x == ".":
+                node2 = stack.pop()
+                node1 = stack.pop()
+                for p in node1.last:
+                    follow[p].update(node2.first)
+                stack.append(_Node(
+                    node1.nullable and node2.nullable,
+                    (
+                        _merge(node1.first, node2.first) if node1.nullable
+                        else node1.first
+                    ),
+                    (
+                        _merge(node1.last, node2.last) if node2.nullable
+                        else node2.last
+                    ),
+                ))
+            elif x == "λ":
+                stack.append(_Node(True, [], []))
+            else:
+                position = len(symbols)
+                symbols.append(x)
+                follow.append(set())
+                stack.append(_Node(False, [position], [position]))
+
+        # La expresion vacia no acepta nada
+        root = stack.pop() if stack else _Node(False, [], [])
+        follow[0].update(root.first)
+
+        finals = set(root.last)
+        if root.nullable:
+            finals.add(0)
+
+        states = [
+            State(str(p), is_final=p in finals)
+            for p in range(len(symbols))
+        ]
+        transitions = [
+            Transition(states[p], symbols[q], states[q])
+            for p in range(len(symbols))
+            for q in follow[p]
+        ]
+
+        return FiniteAutomaton.from_trusted(
+            initial_state=states[0],
+            states=states,
+            symbols=set(symbols[1:]),
+            transitions=transitions,
+        )
@@ -1,32 +1,53 @@
 """General interfaces for automatas."""
+import codecs
+import mmap
+import os
 from abc import ABC, abstractmethod
 from typing import (
+    IO,
     AbstractSet,
     Collection,
+    FrozenSet,
     Generic,
     Optional,
     Sequence,
     Set,
     TypeVar,
+    Union,
 )
 
 
+_NO_PATTERNS: FrozenSet[int] = frozenset()
+
+
 class AbstractState(ABC):
     """
     Abstract definition of an automaton state.
 
+    States use ``__slots__``, and their hash only depends on the name, so
+    changing ``is_final`` does not invalidate the sets and dictionaries that
+    already contain the state.
+
     Args:
         name: Name of the state.
         is_final: Whether the state is a final state or not.
 
+    Attributes:
+        patterns: Ids of the patterns accepted in this state, for automata
+            built from several patterns. Empty by default.
+
     """
 
+    __slots__ = ("name", "is_final", "patterns")
+
     name: str
     is_final: bool
+    patterns: FrozenSet[int]
 
     def __init__(self, name: str, *, is_final: bool = False) -> None:
         self.name = name
         self.is_final = is_final
+        self.patterns = _NO_PATTERNS
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
@@ -43,7 +64,7 @@ class AbstractState(ABC):
         )
 
     def __hash__(self) -> int:
-        return hash((self.name, self.is_final))
+        return hash(self.name)
 
 
 _State = TypeVar("_State", bound=AbstractState, covariant=True)
@@ -53,6 +74,9 @@ class AbstractTransition(ABC, Generic[_State]):
     """
     Abstract definition of an automaton transition.
 
+    Transitions use ``__slots__``, and their hash only depends on the names
+    of their states, so hashing them does not call ``AbstractState.__hash__``.
+
     Args:
         initial_state: Initial state of the transition.
         symbol: Symbol consumed in the transition.
@@ -61,6 +85,8 @@ class AbstractTransition(ABC, Generic[_State]):
 
     """
 
+    __slots__ = ("initial_state", "symbol", "final_state")
+
     initial_state: _State
     symbol: Optional[str]
     final_state: _State
@@ -92,7 +118,7 @@ class AbstractTransition(ABC, Generic[_State]):
         )
 
     def __hash__(self) -> int:
-        return hash((self.initial_state, self.symbol, self.final_state))
+        return hash((self.initial_state.name, self.symbol, self.final_state.name))
 
 
 _Transition = TypeVar(
@@ -137,7 +163,11 @@ class AbstractFiniteAutomaton(
         symbols: Collection[str],
         transitions: Collection[_Transition],
     ) -> None:
-        if initial_state not in states:
+        # Hashed copies, so every membership check below is O(1)
+        state_set = set(states)
+        symbol_set = set(symbols)
+
+        if initial_state not in state_set:
             raise ValueError(
                 f"Initial state {initial_state.name} "
                 f"is not in the set of states",
@@ -145,24 +175,24 @@ class AbstractFiniteAutomaton(
 
         for t in transitions:
             for s in (t.initial_state, t.final_state):
-                if s not in states:
+                if s not in state_set:
                     raise ValueError(
                         f"State {s} from transition {t}"
                         f"is not in the set of states",
                     )
 
-            if t.symbol is not None and t.symbol not in symbols:
+            if t.symbol is not None and t.symbol not in symbol_set:
                 raise ValueError(
                     f"Symbol {t.symbol} from transition {t}"
                     f"is not in the set of symbols",
                 )
 
-        if len(set(states)) != len(states):
+        if len(state_set) != len(states):
             raise ValueError(
                 "There are repeated states",
             )
 
-        if len(set(symbols)) != len(symbols):
+        if len(symbol_set) != len(symbols):
             raise ValueError(
                 "There are repeated symbols",
             )
@@ -292,11 +322,116 @@ class AbstractFiniteAutomatonEvaluator(
         for symbol in string:
             self.process_symbol(symbol)
 
+    def process_stream(
+        self,
+        stream: Union[IO[str], IO[bytes], mmap.mmap],
+        chunk_size: int = 1 << 16,
+        *,
+        stop_if_dead: bool = False,
+        encoding: str = "utf-8",
+    ) -> bool:
+        """
+        Process the symbols read from a file object, chunk by chunk.
+
+        Only one chunk is kept in memory at a time. Binary streams are
+        decoded incrementally, so multibyte characters may be split
+        between chunks.
+
+        Args:
+            stream: Text or binary file object (anything with ``read``).
+            chunk_size: Number of characters (or bytes) read at once.
+            stop_if_dead: Stop reading as soon as no state is reachable.
+                The remaining symbols are then not checked against the
+                alphabet.
+            encoding: Encoding of binary streams.
+
+        Returns:
+            ``False`` if reading stopped early because the evaluator is
+            dead, ``True`` if the whole stream was processed.
+
+        """
+        decoder = None
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+
+            if isinstance(chunk, bytes):
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder(encoding)()
+                chunk = decoder.decode(chunk)
+
+            if not self._process_chunk(chunk, stop_if_dead):
+                return False
+
+        if decoder is not None:
+            return self._process_chunk(
+                decoder.decode(b"", final=True),
+                stop_if_dead,
+            )
+
+        return True
+
+    def _process_chunk(self, chunk: str, stop_if_dead: bool) -> bool:
+        """Process a chunk, returning ``False`` if it stopped when dead."""
+        if not stop_if_dead:
+            self.process_string(chunk)
+            return True
+
+        # Se mira tras cada simbolo, para no leer ni validar el resto
+        for symbol in chunk:
+            self.process_symbol(symbol)
+            if self.is_dead():
+                return False
+        return True
+
+    def process_mmap(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        chunk_size: int = 1 << 16,
+        *,
+        stop_if_dead: bool = False,
+        encoding: str = "utf-8",
+    ) -> bool:
+        """
+        Process the contents of a file through a read-only memory map.
+
+        The file is never loaded fully in memory: the operating system pages
+        it in as the chunks are processed. See ``process_stream`` for the
+        meaning of the arguments and the return value.
+
+        Args:
+            path: Path of the file to process.
+            chunk_size: Number of bytes decoded at once.
+            stop_if_dead: Stop reading as soon as no state is reachable.
+            encoding: Encoding of the file.
+
+        Returns:
+            ``False`` if reading stopped early, ``True`` otherwise.
+
+        """
+        with open(path, "rb") as f:
+            # Empty files cannot be memory mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return True
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self.process_stream(
+                    mapped,
+                    chunk_size,
+                    stop_if_dead=stop_if_dead,
+                    encoding=encoding,
+                )
+
     @abstractmethod
     def is_accepting(self) -> bool:
         """Check if the current state is an accepting one."""
         raise NotImplementedError("This method must be implemented.")
 
+    def is_dead(self) -> bool:
+        """Check if there are no current states, so nothing can be accepted."""
+        return not self.current_states
+
     def accepts(self, string: str) -> bool:
         """
         Return if a string is accepted without changing state.
@@ -312,3 +447,28 @@ class AbstractFiniteAutomatonEvaluator(
             self.current_states = old_states
 
         return accepted
+
+    def matching_patterns(self) -> FrozenSet[int]:
+        """Return the ids of the patterns accepted in the current states."""
+        return frozenset().union(
+            *(s.patterns for s in self.current_states if s.is_final),
+        )
+
+    def match(self, string: str) -> FrozenSet[int]:
+        """
+        Return the ids of the patterns that accept a string.
+
+        The string is processed once, whatever the number of patterns, and
+        the state of the evaluator is left unchanged.
+
+        Note: This function is NOT thread-safe.
+
+        """
+        old_states = self.current_states
+        try:
+            self.process_string(string)
+            patterns = self.matching_patterns()
+        finally:
+            self.current_states = old_states
+
+        return patterns
@@ -0,0 +1,506 @@
+"""Boolean operations and decision procedures on automata."""
+from collections import deque
+from typing import Callable, Deque, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+
+_Subset = FrozenSet[State]
+_Pair = Tuple[_Subset, _Subset]
+_Combine = Callable[[bool, bool], bool]
+
+
+def _intersection(final1: bool, final2: bool) -> bool:
+    return final1 and final2
+
+
+def _union(final1: bool, final2: bool) -> bool:
+    return final1 or final2
+
+
+def _difference(final1: bool, final2: bool) -> bool:
+    return final1 and not final2
+
+
+def _initial_subset(automaton: FiniteAutomaton) -> _Subset:
+    """Lambda closure of the initial state, as a state of the lazy DFA."""
+    closure = {automaton.initial_state}
+    automaton._get_lambda_closure(closure)
+    return frozenset(closure)
+
+
+def _is_final(subset: _Subset) -> bool:
+    return any(st.is_final for st in subset)
+
+
+def _is_dead(combine: _Combine, pair: _Pair) -> bool:
+    """
+    Check if no string can make a pair of subsets accepting.
+
+    An empty subset can never become final again, while a non empty one may
+    or may not.
+    """
+    options1 = (False, True) if pair[0] else (False,)
+    options2 = (False, True) if pair[1] else (False,)
+    return not any(combine(f1, f2) for f1 in options1 for f2 in options2)
+
+
+def _product_moves(
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+    combine: _Combine,
+    pair: _Pair,
+) -> Iterator[Tuple[str, _Pair]]:
+    """
+    Obtain the moves of a pair of subsets that do not lead to a dead pair.
+
+    Only the symbols that some state of the pair actually has are tried, as
+    a pair of empty subsets is dead for every operation.
+    """
+    subset1, subset2 = pair
+    symbols = dict.fromkeys(
+        sym
+        for st in (*subset1, *subset2)
+        for sym in st.transitions
+        if sym is not None
+    )
+    for sym in symbols:
+        next_pair = (
+            frozenset(automaton1._get_symbol_closure(subset1, sym)),
+            frozenset(automaton2._get_symbol_closure(subset2, sym)),
+        )
+        if not _is_dead(combine, next_pair):
+            yield sym, next_pair
+
+
+def _find_accepting_pair(
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+    combine: _Combine,
+) -> Optional[str]:
+    """
+    Search the lazy product for a reachable accepting pair.
+
+    The search is breadth first and stops at the first accepting pair.
+
+    Returns:
+        The shortest string that reaches an accepting pair, or ``None`` if
+        there is none.
+
+    """
+    initial = (_initial_subset(automaton1), _initial_subset(automaton2))
+    if _is_dead(combine, initial):
+        return None
+
+    # Para cada par, el par anterior y el simbolo con el que se llego
+    parents: Dict[_Pair, Optional[Tuple[_Pair, str]]] = {initial: None}
+    pending: Deque[_Pair] = deque([initial])
+    while pending:
+        pair = pending.popleft()
+        if combine(_is_final(pair[0]), _is_final(pair[1])):
+            symbols: List[str] = []
+            parent = parents[pair]
+            while parent is not None:
+                pair, sym = parent
+                symbols.append(sym)
+                parent = parents[pair]
+            return "".join(reversed(symbols))
+
+        for sym, next_pair in _product_moves(automaton1, automaton2, combine, pair):
+            if next_pair not in parents:
+                parents[next_pair] = (pair, sym)
+                pending.append(next_pair)
+
+    return None
+
+
+def _build_product(
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+    combine: _Combine,
+) -> FiniteAutomaton:
+    """
+    Build the deterministic product of two automata.
+
+    Only the pairs of subsets reachable from the initial pair, and that are
+    not dead, are explored.
+    """
+    symbols = tuple(dict.fromkeys((*automaton1.symbols, *automaton2.symbols)))
+
+    initial = (_initial_subset(automaton1), _initial_subset(automaton2))
+    new_states: Dict[_Pair, State] = {}
+    transitions: List[Transition] = []
+
+    def get_state(pair: _Pair) -> State:
+        st = new_states.get(pair)
+        if st is None:
+            st = State(
+                name="q" + str(len(new_states)),
+                is_final=combine(_is_final(pair[0]), _is_final(pair[1])),
+            )
+            new_states[pair] = st
+            pending.append(pair)
+        return st
+
+    pending: Deque[_Pair] = deque()
+    q0 = get_state(initial)
+    while pending:
+        pair = pending.popleft()
+        if _is_dead(combine, pair):
+            continue
+
+        st = new_states[pair]
+        for sym, next_pair in _product_moves(automaton1, automaton2, combine, pair):
+            transitions.append(Transition(st, sym, get_state(next_pair)))
+
+    return FiniteAutomaton.from_trusted(
+        initial_state=q0,
+        states=new_states.values(),
+        symbols=symbols,
+        transitions=transitions,
+    )
+
+
+def _universal_automaton(symbols: Sequence[str]) -> FiniteAutomaton:
+    """Automaton with a single final state that accepts every string."""
+    q0 = State("q0", is_final=True)
+    return FiniteAutomaton.from_trusted(
+        initial_state=q0,
+        states=[q0],
+        symbols=symbols,
+        transitions=[Transition(q0, sym, q0) for sym in symbols],
+    )
+
+
+def intersection(
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+) -> FiniteAutomaton:
+    """
+    Build a deterministic automaton for the intersection of two languages.
+
+    Args:
+        automaton1: First automaton.
+        automaton2: Second automaton.
+
+    Returns:
+        Automaton that accepts the strings accepted by both automata.
+
+    """
+    return _build_product(automaton1, automaton2, _intersection)
+
+
+def union(
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+) -> FiniteAutomaton:
+    """
+    Build a deterministic automaton for the union of two languages.
+
+    Args:
+        automaton1: First automaton.
+        automaton2: Second automaton.
+
+    Returns:
+        Automaton that accepts the strings accepted by either automaton.
+
+    """
+    return _build_product(automaton1, automaton2, _union)
+
+
+def difference(
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+) -> FiniteAutomaton:
+    """
+    Build a deterministic automaton for the difference of two languages.
+
+    Args:
+        automaton1: Automaton whose language is kept.
+        automaton2: Automaton whose language is removed.
+
+    Returns:
+        Automaton that accepts the strings accepted by the first automaton
+        but not by the second.
+
+    """
+    return _build_product(automaton1, automaton2, _difference)
+
+
+def complement(
+    automaton: FiniteAutomaton,
+    symbols: Optional[Sequence[str]] = None,
+) -> FiniteAutomaton:
+    """
+    Build a deterministic automaton for the complement of a language.
+
+    Args:
+        automaton: Automaton to complement.
+        symbols: Alphabet of the complement. By default, the alphabet of
+            the automaton.
+
+    Returns:
+        Automaton that accepts the strings over the alphabet that the
+        automaton rejects.
+
+    """
+    if symbols is None:
+        symbols = automaton.symbols
+
+    return _build_product(_universal_automaton(symbols), automaton, _difference)
+
+
+def is_empty(automaton: FiniteAutomaton) -> bool:
+    """
+    Check if an automaton accepts no string.
+
+    Args:
+        automaton: Automaton to check.
+
+    Returns:
+        ``True`` if the language of the automaton is empty.
+
+    """
+    return _find_accepting_pair(
+        automaton,
+        _universal_automaton(automaton.symbols),
+        _intersection,
+    ) is None
+
+
+def is_disjoint(
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+) -> bool:
+    """
+    Check if two automata accept no common string.
+
+    The product is explored lazily and the search stops at the first string
+    accepted by both automata.
+
+    Args:
+        automaton1: First automaton.
+        automaton2: Second automaton.
+
+    Returns:
+        ``True`` if the languages of the automata are disjoint.
+
+    """
+    return _find_accepting_pair(automaton1, automaton2, _intersection) is None
+
+
+def _antichain_insert(
+    antichain: List[_Subset],
+    subset: _Subset,
+) -> bool:
+    """
+    Insert a subset in an antichain of minimal subsets.
+
+    Args:
+        antichain: Subsets of which none is contained in another.
+        subset: Subset to insert.
+
+    Returns:
+        ``False`` if the subset contains one of the antichain, which then
+        does not change. ``True`` if it was inserted, removing the subsets
+        of the antichain that contain it.
+
+    """
+    if any(old <= subset for old in antichain):
+        return False
+
+    antichain[:] = [old for old in antichain if not subset <= old]
+    antichain.append(subset)
+    return True
+
+
+def is_subset(
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+) -> bool:
+    """
+    Check if every string accepted by an automaton is accepted by another.
+
+    This is the forward antichain algorithm of De Wulf et al., which works
+    directly on the nondeterministic automata and their lambda closures.
+    The search runs over pairs of a state of the first automaton and a
+    subset of states of the second one, and stops at the first pair with a
+    final state and no final state in the subset. A pair is discarded when
+    another pair with the same state and a smaller subset was already
+    found, as any string rejected from the larger subset is also rejected
+    from the smaller one. Usually only a tiny fraction of the subsets is
+    explored, and neither automaton is determinized.
+
+    Args:
+        automaton1: Automaton whose language should be included.
+        automaton2: Automaton whose language should include the other.
+
+    Returns:
+        ``True`` if the language of the first automaton is a subset of the
+        language of the second one.
+
+    """
+    initial2 = _initial_subset(automaton2)
+
+    # Antichain de subconjuntos minimos por cada estado del primer automata
+    antichains: Dict[State, List[_Subset]] = {}
+    pending: Deque[Tuple[State, _Subset]] = deque()
+
+    def add(st: State, subset: _Subset) -> None:
+        if _antichain_insert(antichains.setdefault(st, []), subset):
+            pending.append((st, subset))
+
+    for st in _initial_subset(automaton1):
+        add(st, initial2)
+
+    while pending:
+        st, subset = pending.popleft()
+        # Puede haberse eliminado al insertar un subconjunto menor
+        if subset not in antichains[st]:
+            continue
+
+        if st.is_final and not _is_final(subset):
+            return False
+
+        for sym in st.transitions:
+            if sym is None:
+                continue
+            next_subset = frozenset(automaton2._get_symbol_closure(subset, sym))
+            for next_st in automaton1._get_symbol_closure((st,), sym):
+                add(next_st, next_subset)
+
+    return True
+
+
+def is_universal(
+    automaton: FiniteAutomaton,
+    symbols: Optional[Sequence[str]] = None,
+) -> bool:
+    """
+    Check if an automaton accepts every string over an alphabet.
+
+    This is the forward antichain algorithm of De Wulf et al. on the
+    subsets of states of the automaton. A subset is discarded when a
+    smaller one was already found, as any string rejected from the larger
+    subset is also rejected from the smaller one, so the automaton is never
+    determinized.
+
+    Args:
+        automaton: Automaton to check.
+        symbols: Alphabet of the strings. By default, the alphabet of the
+            automaton.
+
+    Returns:
+        ``True`` if the automaton accepts every string over the alphabet.
+
+    """
+    if symbols is None:
+        symbols = automaton.symbols
+
+    antichain: List[_Subset] = []
+    pending: Deque[_Subset] = deque()
+
+    def add(subset: _Subset) -> None:
+        if _antichain_insert(antichain, subset):
+            pending.append(subset)
+
+    add(_initial_subset(automaton))
+    while pending:
+        subset = pending.popleft()
+        # Puede haberse eliminado al insertar un subconjunto menor
+        if subset not in antichain:
+            continue
+
+        if not _is_final(subset):
+            return False
+
+        for sym in symbols:
+            add(frozenset(automaton._get_symbol_closure(subset, sym)))
+
+    return True
+
+
+def find_counterexample(
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+) -> Optional[str]:
+    """
+    Find a string accepted by exactly one of two automata.
+
+    This is the Hopcroft-Karp algorithm: states of the two lazily
+    determinized automata are merged in a union-find structure as they are
+    proved equivalent, and a pair is only explored when its states were not
+    already in the same class. The disjoint union of the two automata is
+    never built nor minimized, and the work is almost linear in the number
+    of reached subsets.
+
+    Args:
+        automaton1: First automaton.
+        automaton2: Second automaton.
+
+    Returns:
+        A shortest string found that one automaton accepts and the other
+        rejects, or ``None`` if both automata accept the same language.
+
+    """
+    # Los nodos llevan el indice del automata, para mantenerlos disjuntos
+    _Node = Tuple[int, _Subset]
+    automata = (automaton1, automaton2)
+    parent: Dict[_Node, _Node] = {}
+
+    def find(node: _Node) -> _Node:
+        root = node
+        while parent.get(root, root) != root:
+            root = parent[root]
+        # Compresion de caminos
+        while node != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    initial1 = (0, _initial_subset(automaton1))
+    initial2 = (1, _initial_subset(automaton2))
+    parent[initial1] = initial2
+    pending: Deque[Tuple[_Node, _Node, str]] = deque([(initial1, initial2, "")])
+
+    while pending:
+        node1, node2, string = pending.popleft()
+        if _is_final(node1[1]) != _is_final(node2[1]):
+            return string
+
+        symbols = dict.fromkeys(
+            sym
+            for _, subset in (node1, node2)
+            for st in subset
+            for sym in st.transitions
+            if sym is not None
+        )
+        for sym in symbols:
+            next1 = (0, frozenset(automata[0]._get_symbol_closure(node1[1], sym)))
+            next2 = (1, frozenset(automata[1]._get_symbol_closure(node2[1], sym)))
+            root1 = find(next1)
+            root2 = find(next2)
+            if root1 != root2:
+                parent[root1] = root2
+                pending.append((next1, next2, string + sym))
+
+    return None
+
+
+def equivalent(
+    automaton1: FiniteAutomaton,
+    automaton2: FiniteAutomaton,
+) -> bool:
+    """
+    Check if two automata accept the same language.
+
+    See ``find_counterexample`` for the algorithm, and to obtain a string
+    that tells the automata apart.
+
+    Args:
+        automaton1: First automaton.
+        automaton2: Second automaton.
+
+    Returns:
+        ``True`` if both automata accept the same language.
+
+    """
+    return find_counterexample(automaton1, automaton2) is None
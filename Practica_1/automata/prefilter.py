@@ -0,0 +1,250 @@
+"""Literal prefilters that discard inputs before running an automaton."""
+import os
+from typing import AbstractSet, FrozenSet, Iterable, List, Optional, Union
+
+from automata.re_parser_interfaces import _re_to_rpn
+
+# Maximo numero de cadenas exactas que se siguen por subexpresion
+_MAX_EXACT = 16
+
+
+def _common_prefix(strings: Iterable[str]) -> str:
+    strings = list(strings)
+    return os.path.commonprefix(strings) if strings else ""
+
+
+def _common_suffix(strings: Iterable[str]) -> str:
+    return _common_prefix(s[::-1] for s in strings)[::-1]
+
+
+def _common_substring(strings: AbstractSet[str]) -> str:
+    """Longest substring contained in every string of a non empty set."""
+    shortest = min(strings, key=len)
+
+    def common(length: int) -> Optional[str]:
+        candidates = {
+            shortest[i:i + length]
+            for i in range(len(shortest) - length + 1)
+        }
+        for string in strings:
+            candidates = {c for c in candidates if c in string}
+        return min(candidates) if candidates else None
+
+    # Busqueda binaria: si hay una comun de longitud n, la hay de n - 1
+    low, high = 0, len(shortest)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if common(middle) is None:
+            high = middle - 1
+        else:
+            low = middle
+
+    return common(low) or ""
+
+
+def _without_substrings(literals: AbstractSet[str]) -> FrozenSet[str]:
+    """Drop the literals that are contained in a longer required literal."""
+    return frozenset(
+        s for s in literals
+        if s and not any(s != t and s in t for t in literals)
+    )
+
+
+class _Info():
+    """
+    What is known about the strings matched by a subexpression.
+
+    Either the finite set of strings is known exactly, or the prefix and the
+    suffix shared by all of them and a set of literals that every one of
+    them contains.
+    """
+
+    __slots__ = ("exact", "prefix", "suffix", "required")
+
+    exact: Optional[FrozenSet[str]]
+    prefix: str
+    suffix: str
+    required: FrozenSet[str]
+
+    def __init__(
+        self,
+        *,
+        exact: Optional[AbstractSet[str]] = None,
+        prefix: str = "",
+        suffix: str = "",
+        required: AbstractSet[str] = frozenset(),
+    ) -> None:
+        if exact is not None and len(exact) > _MAX_EXACT:
+            # Demasiadas cadenas: nos quedamos con lo que comparten
+            prefix = _common_prefix(exact)
+            suffix = _common_suffix(exact)
+            required = {_common_substring(exact)}
+            exact = None
+
+        self.exact = None if exact is None else frozenset(exact)
+        self.prefix = prefix
+        self.suffix = suffix
+        self.required = _without_substrings(required | {prefix, suffix})
+
+    def get_prefix(self) -> str:
+        if self.exact is not None:
+            return _common_prefix(self.exact)
+        return self.prefix
+
+    def get_suffix(self) -> str:
+        if self.exact is not None:
+            return _common_suffix(self.exact)
+        return self.suffix
+
+    def get_required(self) -> FrozenSet[str]:
+        if self.exact is not None:
+            if not self.exact:
+                return frozenset()
+            return _without_substrings({
+                self.get_prefix(),
+                self.get_suffix(),
+                _common_substring(self.exact),
+            })
+        return self.required
+
+
+def _union(info1: _Info, info2: _Info) -> _Info:
+    if info1.exact is not None and info2.exact is not None:
+        return _Info(exact=info1.exact | info2.exact)
+
+    return _Info(
+        prefix=_common_prefix([info1.get_prefix(), info2.get_prefix()]),
+        suffix=_common_suffix([info1.get_suffix(), info2.get_suffix()]),
+        required=info1.get_required() & info2.get_required(),
+    )
+
+
+def _concat(info1: _Info, info2: _Info) -> _Info:
+    if (
+        info1.exact is not None
+        and info2.exact is not None
+        and len(info1.exact) * len(info2.exact) <= _MAX_EXACT
+    ):
+        return _Info(exact={s1 + s2 for s1 in info1.exact for s2 in info2.exact})
+
+    if info1.exact is not None:
+        prefix = _common_prefix(s + info2.get_prefix() for s in info1.exact)
+    else:
+        prefix = info1.prefix
+
+    if info2.exact is not None:
+        suffix = _common_suffix(info1.get_suffix() + s for s in info2.exact)
+    else:
+        suffix = info2.suffix
+
+    # El final de la primera parte va seguido del principio de la segunda
+    return _Info(
+        prefix=prefix,
+        suffix=suffix,
+        required=(
+            info1.get_required()
+            | info2.get_required()
+            | {info1.get_suffix() + info2.get_prefix()}
+        ),
+    )
+
+
+def required_literals(re_string: str) -> FrozenSet[str]:
+    """
+    Find literal substrings that every match of a regex must contain.
+
+    The regex is analyzed bottom-up in reverse polish notation, as in
+    ``AbstractREParser.create_automaton``. Small finite sets of strings are
+    tracked exactly, and otherwise the common prefix and suffix and the
+    literals required by every alternative are kept. The analysis is
+    conservative: the literals may be shorter than possible, but every
+    match contains all of them.
+
+    Args:
+        re_string: String with the regular expression in Kleene notation.
+
+    Returns:
+        Non empty literals that every match contains. The empty set means
+        that nothing is required.
+
+    """
+    if not re_string:
+        return frozenset()
+
+    stack: List[_Info] = []
+    for x in _re_to_rpn(re_string):
+        if x == "*":
+            # Puede repetirse cero veces, asi que no hay nada obligatorio
+            stack.pop()
+            stack.append(_Info())
+        elif x == "+":
+            info2 = stack.pop()
+            info1 = stack.pop()
+            stack.append(_union(info1, info2))
+        elif x == ".":
+            info2 = stack.pop()
+            info1 = stack.pop()
+            stack.append(_concat(info1, info2))
+        elif x == "λ":
+            stack.append(_Info(exact={""}))
+        else:
+            stack.append(_Info(exact={x}))
+
+    return stack.pop().get_required()
+
+
+class Prefilter():
+    """
+    Check the literals required by a regex before running an automaton.
+
+    Inputs that do not contain every required literal can not match, and
+    they are discarded with ``str.find`` (or ``bytes.find``), which is much
+    faster than feeding the input to an evaluator. The longest literals are
+    checked first, as they are usually the most selective.
+
+    Args:
+        literals: Literals that every match contains.
+
+    """
+
+    literals: List[str]
+
+    def __init__(self, literals: Iterable[str]) -> None:
+        self.literals = sorted(set(literals), key=lambda s: (-len(s), s))
+        self._encoded = [s.encode("utf-8") for s in self.literals]
+
+    @classmethod
+    def from_regex(cls, re_string: str) -> "Prefilter":
+        """
+        Create the prefilter of a regex.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+
+        Returns:
+            Prefilter with the literals required by the regex.
+
+        """
+        return cls(required_literals(re_string))
+
+    def might_match(self, text: Union[str, bytes], start: int = 0) -> bool:
+        """
+        Check if an input contains every required literal.
+
+        Args:
+            text: Input, as a string or as UTF-8 encoded bytes.
+            start: Position where the region to check starts.
+
+        Returns:
+            ``False`` if the input can not contain a match, ``True`` if it
+            might.
+
+        """
+        literals = self._encoded if isinstance(text, bytes) else self.literals
+        return all(
+            text.find(literal, start) >= 0  # type: ignore[arg-type]
+            for literal in literals
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.literals!r})"
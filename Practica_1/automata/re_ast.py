@@ -0,0 +1,597 @@
+"""Hash-consed abstract syntax trees of regular expressions."""
+import weakref
+import zlib
+from collections import deque
+from typing import Any, Callable, ClassVar, Deque, Dict, Iterable, List, Tuple
+from typing import Union as Union_
+
+from automata.re_parser_interfaces import _re_to_rpn
+
+
+class Regex():
+    """
+    Node of a regex syntax tree.
+
+    Nodes are hash-consed: building a node equal to an existing one returns
+    the existing object, so equality is identity and the hash is cached.
+    Nodes are ordered by their structure (see ``__lt__``), so normalized
+    unions do not depend on the other nodes that exist. The table of nodes only keeps weak references, so unused nodes are
+    freed. Every node also knows whether it accepts the empty string and
+    keeps its derivatives once computed (see ``automata.derivatives``).
+
+    Nodes must be created with the constructors of each subclass, which
+    intern them, or with the smart constructors ``union``, ``concat`` and
+    ``star``, which also normalize them.
+    """
+
+    __slots__ = ("nullable", "derivatives", "_size", "_shape", "__weakref__")
+
+    nullable: bool
+    derivatives: Dict[str, "Regex"]
+    _size: int
+    _shape: int
+
+    _table: ClassVar["weakref.WeakValueDictionary[Tuple[Any, ...], Regex]"] = (
+        weakref.WeakValueDictionary()
+    )
+    _kind: ClassVar[int] = 0
+
+    @classmethod
+    def _intern(cls, key: Tuple[Any, ...], nullable: bool) -> Any:
+        node = Regex._table.get(key)
+        if node is None:
+            node = object.__new__(cls)
+            node.nullable = nullable
+            node.derivatives = {}
+            node._init(*key[1:])
+
+            # Tamaño y huella de la estructura, a partir de los hijos
+            operands = node._operands()
+            node._size = 1 + sum(o._size for o in operands)
+            shape = _mix(cls._kind, node._label_hash())
+            for o in operands:
+                shape = _mix(shape, o._shape)
+            node._shape = shape
+
+            Regex._table[key] = node
+        return node
+
+    def _init(self, *args: Any) -> None:
+        pass
+
+    def _operands(self) -> Tuple["Regex", ...]:
+        return ()
+
+    def _label_hash(self) -> int:
+        return 0
+
+    def _token(self) -> Tuple[int, str, int]:
+        return (self._kind, getattr(self, "symbol", ""), len(self._operands()))
+
+    def __lt__(self, other: "Regex") -> bool:
+        # Orden estructural, que no depende del orden de creacion de los
+        # nodos: primero el tamaño y la huella, y si coinciden, el recorrido
+        # en preorden de ambos arboles
+        if self._size != other._size:
+            return self._size < other._size
+        if self._shape != other._shape:
+            return self._shape < other._shape
+
+        to_compare = [(self, other)]
+        while to_compare:
+            node1, node2 = to_compare.pop()
+            if node1 is node2:
+                continue
+            token1, token2 = node1._token(), node2._token()
+            if token1 != token2:
+                return token1 < token2
+            to_compare.extend(
+                reversed(list(zip(node1._operands(), node2._operands()))),
+            )
+        return False
+
+
+_SHAPE_MASK = (1 << 64) - 1
+
+
+def _mix(shape: int, value: int) -> int:
+    """Combine a value into a structural fingerprint (FNV-1a style)."""
+    return ((shape ^ value) * 0x100000001B3) & _SHAPE_MASK
+
+
+class Empty(Regex):
+    """Regex of the empty language (∅)."""
+
+    __slots__ = ()
+
+    _kind = 1
+
+    def __new__(cls) -> "Empty":
+        return cls._intern((cls,), nullable=False)
+
+    def __repr__(self) -> str:
+        return "Empty()"
+
+
+class Lambda(Regex):
+    """Regex of the empty string (λ)."""
+
+    __slots__ = ()
+
+    _kind = 2
+
+    def __new__(cls) -> "Lambda":
+        return cls._intern((cls,), nullable=True)
+
+    def __repr__(self) -> str:
+        return "Lambda()"
+
+
+class Symbol(Regex):
+    """Regex of a single symbol."""
+
+    __slots__ = ("symbol",)
+
+    symbol: str
+
+    def __new__(cls, symbol: str) -> "Symbol":
+        return cls._intern((cls, symbol), nullable=False)
+
+    _kind = 3
+
+    def _init(self, symbol: str) -> None:  # type: ignore[override]
+        self.symbol = symbol
+
+    def _label_hash(self) -> int:
+        # crc32 y no hash(), que cambia de un proceso a otro
+        return zlib.crc32(self.symbol.encode("utf-8", "surrogatepass"))
+
+    def __repr__(self) -> str:
+        return f"Symbol({self.symbol!r})"
+
+
+class Star(Regex):
+    """Kleene star of a regex."""
+
+    __slots__ = ("inner",)
+
+    inner: Regex
+
+    def __new__(cls, inner: Regex) -> "Star":
+        return cls._intern((cls, inner), nullable=True)
+
+    _kind = 4
+
+    def _init(self, inner: Regex) -> None:  # type: ignore[override]
+        self.inner = inner
+
+    def _operands(self) -> Tuple[Regex, ...]:
+        return (self.inner,)
+
+    def __repr__(self) -> str:
+        return f"Star({self.inner!r})"
+
+
+class Concat(Regex):
+    """Concatenation of two regexes."""
+
+    __slots__ = ("left", "right")
+
+    left: Regex
+    right: Regex
+
+    def __new__(cls, left: Regex, right: Regex) -> "Concat":
+        return cls._intern(
+            (cls, left, right),
+            nullable=left.nullable and right.nullable,
+        )
+
+    _kind = 5
+
+    def _init(self, left: Regex, right: Regex) -> None:  # type: ignore[override]
+        self.left = left
+        self.right = right
+
+    def _operands(self) -> Tuple[Regex, ...]:
+        return (self.left, self.right)
+
+    def __repr__(self) -> str:
+        return f"Concat({self.left!r}, {self.right!r})"
+
+
+class Union(Regex):
+    """Union of two or more regexes."""
+
+    __slots__ = ("alternatives",)
+
+    alternatives: Tuple[Regex, ...]
+
+    def __new__(cls, *alternatives: Regex) -> "Union":
+        return cls._intern(
+            (cls, *alternatives),
+            nullable=any(a.nullable for a in alternatives),
+        )
+
+    _kind = 6
+
+    def _init(self, *alternatives: Regex) -> None:  # type: ignore[override]
+        self.alternatives = alternatives
+
+    def _operands(self) -> Tuple[Regex, ...]:
+        return self.alternatives
+
+    def __repr__(self) -> str:
+        return f"Union({', '.join(map(repr, self.alternatives))})"
+
+
+def union(alternatives: Iterable[Regex]) -> Regex:
+    """
+    Build a normalized union.
+
+    Nested unions are flattened, repeated alternatives removed and the rest
+    sorted (associativity, commutativity and idempotence), and ``∅`` is
+    dropped, as it is the identity.
+    """
+    flat: List[Regex] = []
+    for alternative in alternatives:
+        if isinstance(alternative, Union):
+            flat.extend(alternative.alternatives)
+        elif not isinstance(alternative, Empty):
+            flat.append(alternative)
+
+    unique = sorted(set(flat))
+    if not unique:
+        return Empty()
+    if len(unique) == 1:
+        return unique[0]
+    return Union(*unique)
+
+
+def concat(left: Regex, right: Regex) -> Regex:
+    """
+    Build a normalized concatenation.
+
+    ``∅`` absorbs, ``λ`` is the identity and concatenations are kept
+    associated to the right.
+    """
+    if isinstance(left, Empty) or isinstance(right, Empty):
+        return Empty()
+    if isinstance(left, Lambda):
+        return right
+    if isinstance(right, Lambda):
+        return left
+
+    # (r.s).t = r.(s.t): se sacan los factores de left, que tambien pueden
+    # estar asociados a la izquierda, sin recursion para cadenas largas
+    factors: List[Regex] = []
+    to_visit = [left]
+    while to_visit:
+        current = to_visit.pop()
+        if isinstance(current, Concat):
+            to_visit.extend((current.right, current.left))
+        else:
+            factors.append(current)
+    for factor in reversed(factors):
+        right = Concat(factor, right)
+    return right
+
+
+def star(inner: Regex) -> Regex:
+    """
+    Build a normalized Kleene star.
+
+    ``∅*`` and ``λ*`` are ``λ``, and ``(r*)*`` is ``r*``.
+    """
+    if isinstance(inner, (Empty, Lambda)):
+        return Lambda()
+    if isinstance(inner, Star):
+        return inner
+    return Star(inner)
+
+
+def parse(re_string: str, *, normalize: bool = False) -> Regex:
+    """
+    Build the syntax tree of a regex.
+
+    The tree is built bottom-up from the reverse polish notation, as in
+    ``AbstractREParser.create_automaton``, so it has the operators as
+    written. With ``normalize``, the smart constructors are used instead.
+
+    Args:
+        re_string: String with the regular expression in Kleene notation.
+        normalize: Whether to normalize the tree while building it.
+
+    Returns:
+        Root of the syntax tree. The empty string is the empty language.
+
+    """
+    if not re_string:
+        return Empty()
+
+    # Con normalize, las uniones pendientes se acumulan en listas y las
+    # concatenaciones en colas, y se normalizan una sola vez, para no
+    # recorrerlas en cada "+" o "."
+    stack: List[Union_[Regex, List[Regex], Deque[Regex]]] = []
+
+    def resolve(item: Union_[Regex, List[Regex], Deque[Regex]]) -> Regex:
+        if isinstance(item, list):
+            return union(item)
+        if isinstance(item, deque):
+            node = item.pop()
+            while item:
+                node = concat(item.pop(), node)
+            return node
+        return item
+
+    def pop() -> Regex:
+        return resolve(stack.pop())
+
+    for x in _re_to_rpn(re_string):
+        if x == "*":
+            inner = pop()
+            stack.append(star(inner) if normalize else Star(inner))
+        elif x == "+":
+            if normalize:
+                right = stack.pop()
+                left = stack.pop()
+                rights = right if isinstance(right, list) else [resolve(right)]
+                lefts = left if isinstance(left, list) else [resolve(left)]
+                if len(lefts) < len(rights):
+                    lefts, rights = rights, lefts
+                lefts.extend(rights)
+                stack.append(lefts)
+            else:
+                right = pop()
+                left = pop()
+                stack.append(Union(left, right))
+        elif x == ".":
+            if normalize:
+                right = stack.pop()
+                left = stack.pop()
+                right_factors = right if isinstance(right, deque) else deque([resolve(right)])
+                left_factors = left if isinstance(left, deque) else deque([resolve(left)])
+                # Se amplia la cola mas larga, por el lado que corresponda
+                if len(left_factors) >= len(right_factors):
+                    left_factors.extend(right_factors)
+                    stack.append(left_factors)
+                else:
+                    right_factors.extendleft(reversed(left_factors))
+                    stack.append(right_factors)
+            else:
+                right = pop()
+                left = pop()
+                stack.append(Concat(left, right))
+        elif x == "λ":
+            stack.append(Lambda())
+        else:
+            stack.append(Symbol(x))
+
+    return pop()
+
+
+def symbols_of(node: Regex) -> List[str]:
+    """Obtain the symbols of a regex, in order of first appearance."""
+    found: Dict[str, None] = {}
+    seen = set()
+    to_visit: List[Regex] = [node]
+    while to_visit:
+        current = to_visit.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+
+        if isinstance(current, Symbol):
+            found[current.symbol] = None
+        elif isinstance(current, Star):
+            to_visit.append(current.inner)
+        elif isinstance(current, Concat):
+            to_visit.extend((current.right, current.left))
+        elif isinstance(current, Union):
+            to_visit.extend(reversed(current.alternatives))
+
+    return list(found)
+
+
+
+def _children(node: Regex) -> Tuple[Regex, ...]:
+    """
+    Children of a node.
+
+    Nested unions are taken as a single union and nested concatenations as
+    a single concatenation, whatever their associativity.
+    """
+    if isinstance(node, Star):
+        return (node.inner,)
+    if isinstance(node, Concat):
+        return _leaves(node, Concat, lambda n: (n.left, n.right))
+    if isinstance(node, Union):
+        return _leaves(node, Union, lambda n: n.alternatives)
+    return ()
+
+
+def _leaves(
+    node: Regex,
+    kind: type,
+    operands: Callable[[Any], Tuple[Regex, ...]],
+) -> Tuple[Regex, ...]:
+    """Operands of a chain of nodes of one kind, from left to right."""
+    leaves: List[Regex] = []
+    to_visit = list(reversed(operands(node)))
+    while to_visit:
+        current = to_visit.pop()
+        if isinstance(current, kind):
+            to_visit.extend(reversed(operands(current)))
+        else:
+            leaves.append(current)
+    return tuple(leaves)
+
+
+def _factors(node: Regex) -> List[Regex]:
+    """Split a right-associated concatenation in its factors."""
+    factors: List[Regex] = []
+    while isinstance(node, Concat):
+        factors.append(node.left)
+        node = node.right
+    if not isinstance(node, Lambda):
+        factors.append(node)
+    return factors
+
+
+def _simple_union(alternatives: Iterable[Regex]) -> Regex:
+    """Normalized union that also drops ``λ`` if another option accepts it."""
+    node = union(alternatives)
+    if isinstance(node, Union) and Lambda() in node.alternatives:
+        others = [a for a in node.alternatives if not isinstance(a, Lambda)]
+        if any(a.nullable for a in others):
+            return union(others)
+    return node
+
+
+class _Trie():
+    """Alternatives of a union, stored by their factors."""
+
+    __slots__ = ("children", "is_end")
+
+    def __init__(self) -> None:
+        self.children: Dict[Regex, _Trie] = {}
+        self.is_end = False
+
+
+def _factor_union(alternatives: Iterable[Regex]) -> Regex:
+    """
+    Build a union, left-factoring the alternatives with the same prefix.
+
+    The alternatives are put in a trie by their factors, so that
+    ``a.b + a.c`` becomes ``a.(b + c)``, and the trie is turned back into a
+    regex bottom-up.
+    """
+    flat = union(alternatives)
+    if not isinstance(flat, Union):
+        return flat
+
+    root = _Trie()
+    for alternative in flat.alternatives:
+        trie = root
+        for factor in _factors(alternative):
+            trie = trie.children.setdefault(factor, _Trie())
+        trie.is_end = True
+
+    # Recorrido en postorden sin recursion
+    built: Dict[int, Regex] = {}
+    stack = [root]
+    while stack:
+        trie = stack[-1]
+        pending = [c for c in trie.children.values() if id(c) not in built]
+        if pending:
+            stack.extend(pending)
+            continue
+
+        stack.pop()
+        options = [
+            concat(factor, built[id(child)])
+            for factor, child in trie.children.items()
+        ]
+        if trie.is_end:
+            options.append(Lambda())
+        built[id(trie)] = _simple_union(options)
+
+    return built[id(root)]
+
+
+def _simplify_node(node: Regex, children: List[Regex]) -> Regex:
+    """Rebuild a node from its simplified children."""
+    if isinstance(node, Star):
+        inner = children[0]
+        # (λ + r)* = r* y (r* + s)* = (r + s)*
+        if isinstance(inner, Union):
+            inner = union(
+                a.inner if isinstance(a, Star) else a
+                for a in inner.alternatives
+                if not isinstance(a, Lambda)
+            )
+        return star(inner)
+    if isinstance(node, Concat):
+        # Se concatena de derecha a izquierda, asi cada factor se anade en
+        # tiempo constante
+        result = children[-1]
+        for factor in reversed(children[:-1]):
+            result = concat(factor, result)
+        return result
+    if isinstance(node, Union):
+        return _factor_union(children)
+    return node
+
+
+def simplify(node: Regex) -> Regex:
+    """
+    Simplify a regex before building its automaton.
+
+    The tree is rebuilt bottom-up with the smart constructors, which remove
+    redundant forms such as ``λ.a``, ``(a*)*`` or ``a+a``, plus a few more
+    identities (``(λ+a)*`` is ``a*``, and ``λ`` is dropped from a union
+    that already accepts it). Unions are also left-factored, so ``a.b+a.c``
+    becomes ``a.(b+c)``.
+
+    Args:
+        node: Regex to simplify.
+
+    Returns:
+        Equivalent regex, usually with fewer operators.
+
+    """
+    simplified: Dict[Regex, Regex] = {}
+    stack = [node]
+    while stack:
+        current = stack[-1]
+        if current in simplified:
+            stack.pop()
+            continue
+
+        children = _children(current)
+        pending = [c for c in children if c not in simplified]
+        if pending:
+            stack.extend(pending)
+            continue
+
+        stack.pop()
+        simplified[current] = _simplify_node(
+            current,
+            [simplified[c] for c in children],
+        )
+
+    return simplified[node]
+
+
+def to_rpn(node: Regex) -> str:
+    """
+    Write a regex in the reverse polish notation of ``_re_to_rpn``.
+
+    Args:
+        node: Regex to write. The empty language can only be the root.
+
+    Returns:
+        The regex in reverse polish notation, empty for the empty language.
+
+    """
+    parts: List[str] = []
+    # Pila de nodos por visitar y de operadores ya listos para escribir
+    stack: List[Union_[Regex, str]] = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            parts.append(current)
+        elif isinstance(current, Symbol):
+            parts.append(current.symbol)
+        elif isinstance(current, Lambda):
+            parts.append("λ")
+        elif isinstance(current, Star):
+            stack.extend(("*", current.inner))
+        elif isinstance(current, Concat):
+            stack.extend((".", current.right, current.left))
+        elif isinstance(current, Union):
+            first, *others = current.alternatives
+            for alternative in reversed(others):
+                stack.extend(("+", alternative))
+            stack.append(first)
+
+    return "".join(parts)
@@ -1,11 +1,191 @@
 """Conversion from regex to automata."""
+from automata import re_ast
 from automata.automaton import FiniteAutomaton, State, Transition
-from automata.re_parser_interfaces import AbstractREParser
-from typing import Set
+from automata.re_parser_interfaces import AbstractREParser, _re_to_rpn
+from typing import Callable, List, Sequence, Set, Tuple
+
+# Fragmento de Thompson: estado inicial y unico estado final
+_Fragment = Tuple[State, State]
+
+
+class _ThompsonBuilder():
+    """
+    Thompson construction over shared buffers.
+
+    Every fragment has one initial and one final state, so each operator
+    only appends two new states and its lambda transitions, in constant
+    time. The automaton is created once, at the end, and the fragments of
+    several patterns can share the same buffers.
+    """
+
+    def __init__(self, next_state_name: Callable[[], str]) -> None:
+        self._next_state_name = next_state_name
+        self.states: List[State] = []
+        self.symbols: Set[str] = set()
+        self.transitions: List[Transition] = []
+
+    def _new_fragment(self) -> _Fragment:
+        q0 = State(name=self._next_state_name(), is_final=False)
+        qf = State(name=self._next_state_name(), is_final=False)
+        self.states.append(q0)
+        self.states.append(qf)
+        return q0, qf
+
+    def empty(self) -> _Fragment:
+        return self._new_fragment()
+
+    def lambda_(self) -> _Fragment:
+        q0, qf = self._new_fragment()
+        self.transitions.append(Transition(q0, None, qf))
+        return q0, qf
+
+    def symbol(self, symbol: str) -> _Fragment:
+        q0, qf = self._new_fragment()
+        self.symbols.add(symbol)
+        self.transitions.append(Transition(q0, symbol, qf))
+        return q0, qf
+
+    def star(self, fragment: _Fragment) -> _Fragment:
+        q0, qf = self._new_fragment()
+        self.transitions.extend([
+            Transition(q0, None, qf),
+            Transition(qf, None, q0),
+            Transition(q0, None, fragment[0]),
+            Transition(fragment[1], None, qf),
+        ])
+        return q0, qf
+
+    def union(self, fragment1: _Fragment, fragment2: _Fragment) -> _Fragment:
+        q0, qf = self._new_fragment()
+        self.transitions.extend([
+            Transition(q0, None, fragment1[0]),
+            Transition(q0, None, fragment2[0]),
+            Transition(fragment1[1], None, qf),
+            Transition(fragment2[1], None, qf),
+        ])
+        return q0, qf
+
+    def concat(self, fragment1: _Fragment, fragment2: _Fragment) -> _Fragment:
+        q0, qf = self._new_fragment()
+        self.transitions.extend([
+            Transition(q0, None, fragment1[0]),
+            Transition(fragment1[1], None, fragment2[0]),
+            Transition(fragment2[1], None, qf),
+        ])
+        return q0, qf
+
+    def build(self, fragment: _Fragment) -> FiniteAutomaton:
+        fragment[1].is_final = True
+        return self._create(fragment[0])
+
+    def build_multi(self, fragments: Sequence[_Fragment]) -> FiniteAutomaton:
+        # El estado final de cada fragmento se etiqueta con su posicion
+        q0 = State(name=self._next_state_name(), is_final=False)
+        self.states.append(q0)
+        for pattern_id, (initial, final) in enumerate(fragments):
+            final.is_final = True
+            final.patterns = frozenset([pattern_id])
+            self.transitions.append(Transition(q0, None, initial))
+        return self._create(q0)
+
+    def _create(self, initial_state: State) -> FiniteAutomaton:
+        return FiniteAutomaton.from_trusted(
+            initial_state=initial_state,
+            states=self.states,
+            symbols=self.symbols,
+            transitions=self.transitions,
+        )
 
 
 class REParser(AbstractREParser):
-    """Class for processing regular expressions in Kleene's syntax."""
+    """
+    Class for processing regular expressions in Kleene's syntax.
+
+    Regexes are built with a linear Thompson construction over shared
+    buffers. The ``_create_automaton_*`` methods, which build every step as
+    a complete automaton, remain the reference construction of
+    ``AbstractREParser``.
+
+    Before the construction, regexes are simplified and left-factored (see
+    ``automata.re_ast.simplify``), so redundant operators do not become
+    states.
+
+    Args:
+        simplify: Whether to simplify the regexes before building them.
+
+    """
+
+    def __init__(self, *, simplify: bool = True) -> None:
+        super().__init__()
+        self.simplify = simplify
+
+    def create_multi_automaton(
+        self,
+        re_strings: Sequence[str],
+    ) -> FiniteAutomaton:
+        """
+        Create a single automaton from several regexes.
+
+        The final state of the ``i``-th regex is labelled with the pattern
+        id ``i`` (see ``AbstractState.patterns``). The labels are preserved
+        by ``to_deterministic`` and ``to_minimized``, so one evaluation pass
+        obtains every matching pattern id with ``match``.
+
+        Args:
+            re_strings: Strings with the regular expressions in Kleene
+                notation.
+
+        Returns:
+            Automaton that accepts the union of the regexes, with the
+            pattern ids in its final states.
+
+        """
+        # Todos los patrones se construyen sobre los mismos buffers, y las
+        # transiciones se indexan una sola vez
+        self.state_counter = 0
+        builder = _ThompsonBuilder(self._next_state_name)
+        return builder.build_multi(
+            [self._build_fragment(builder, r) for r in re_strings],
+        )
+
+    def _build_automaton(
+        self,
+        re_string: str,
+    ) -> FiniteAutomaton:
+        builder = _ThompsonBuilder(self._next_state_name)
+        return builder.build(self._build_fragment(builder, re_string))
+
+    def _build_fragment(
+        self,
+        builder: _ThompsonBuilder,
+        re_string: str,
+    ) -> _Fragment:
+        """Add the fragment of a regex to the buffers of a builder."""
+        if self.simplify:
+            rpn_string = re_ast.to_rpn(re_ast.simplify(re_ast.parse(re_string)))
+        else:
+            rpn_string = _re_to_rpn(re_string) if re_string else ""
+        if not rpn_string:
+            return builder.empty()
+
+        stack: List[_Fragment] = []
+        for x in rpn_string:
+            if x == "*":
+                stack.append(builder.star(stack.pop()))
+            elif x == "+":
+                fragment2 = stack.pop()
+                fragment1 = stack.pop()
+                stack.append(builder.union(fragment1, fragment2))
+            elif x == ".":
+                fragment2 = stack.pop()
+                fragment1 = stack.pop()
+                stack.append(builder.concat(fragment1, fragment2))
+            elif x == "λ":
+                stack.append(builder.lambda_())
+            else:
+                stack.append(builder.symbol(x))
+
+        return stack.pop()
 
     def _next_state_name(self) -> str:
         """
@@ -26,7 +206,7 @@ class REParser(AbstractREParser):
         transitions : Set[Transition] = set()
         states = set([q0, qf])
 
-        return FiniteAutomaton(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
+        return FiniteAutomaton.from_trusted(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
 
 
     def _create_automaton_lambda(
@@ -40,7 +220,7 @@ class REParser(AbstractREParser):
         transitions = set([Transition(initial_state=q0, symbol=None, final_state=qf)])
         states  = set([q0, qf])
 
-        return FiniteAutomaton(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
+        return FiniteAutomaton.from_trusted(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
 
 
     def _create_automaton_symbol(
@@ -54,7 +234,7 @@ class REParser(AbstractREParser):
         transitions = set([Transition(initial_state=q0, symbol=symbol, final_state=qf)])
         states = set([q0, qf])
 
-        return FiniteAutomaton(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
+        return FiniteAutomaton.from_trusted(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
 
 
     def _create_automaton_star(
@@ -81,7 +261,7 @@ class REParser(AbstractREParser):
         states = set([q0, qf])
         states.update(automaton.states)
 
-        return FiniteAutomaton(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
+        return FiniteAutomaton.from_trusted(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
 
 
     def _create_automaton_union(
@@ -116,7 +296,7 @@ class REParser(AbstractREParser):
         states.update(automaton1.states)
         states.update(automaton2.states)
 
-        return FiniteAutomaton(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
+        return FiniteAutomaton.from_trusted(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
 
 
     def _create_automaton_concat(
@@ -150,4 +330,4 @@ class REParser(AbstractREParser):
         states.update(automaton1.states)
         states.update(automaton2.states)
 
-        return FiniteAutomaton(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
+        return FiniteAutomaton.from_trusted(initial_state=q0, states=states, symbols=symbols, transitions=transitions)
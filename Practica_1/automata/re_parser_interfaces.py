@@ -167,13 +167,20 @@ class AbstractREParser(ABC):
             Automaton equivalent to the regex.
 
         """
+        self.state_counter = 0
+        return self._build_automaton(re_string)
+
+    def _build_automaton(
+        self,
+        re_string: str,
+    ) -> FiniteAutomaton:
+        """Create an automaton from a regex, naming states from the counter."""
         if not re_string:
             return self._create_automaton_empty()
-        
+
         rpn_string = _re_to_rpn(re_string)
 
         stack: List[FiniteAutomaton] = []
-        self.state_counter = 0
         for x in rpn_string:
             if x == "*":
                 aut = stack.pop()
@@ -0,0 +1,190 @@
+"""Unanchored search of the matches of an automaton inside a text."""
+from typing import Iterator, List, Optional, Tuple
+
+from automata.automaton import FiniteAutomaton, Transition
+from automata.compiled import CompiledAutomaton
+from automata.prefilter import Prefilter
+
+_Span = Tuple[int, int]
+
+
+def _reverse_with_prefix(automaton: FiniteAutomaton) -> FiniteAutomaton:
+    """
+    Build an automaton for Σ* followed by the reverse of the language.
+
+    The initial state of the reversed automaton only has lambda transitions,
+    so a self-loop on it with every symbol is the Σ* prefix.
+    """
+    reversed_automaton = automaton.reverse()
+    initial = reversed_automaton.initial_state
+
+    transitions = list(reversed_automaton.transitions)
+    transitions.extend(
+        Transition(initial, symbol, initial)
+        for symbol in reversed_automaton.symbols
+    )
+
+    return FiniteAutomaton.from_trusted(
+        initial_state=initial,
+        states=reversed_automaton.states,
+        symbols=reversed_automaton.symbols,
+        transitions=transitions,
+    )
+
+
+class Searcher():
+    """
+    Find the matches of an automaton inside a text.
+
+    Matches follow the leftmost-longest rule: the match that starts first
+    is chosen, and among those the longest one. Symbols of the text that
+    are not in the alphabet of the automaton are allowed, and simply cannot
+    be part of a match.
+
+    The text is first scanned backwards, once, with a DFA of Σ* followed by
+    the reverse of the language: the DFA accepts just after reading the
+    symbol at position ``i`` when some match starts at ``i``. Then each
+    match is extended forwards from its start with the DFA of the
+    language, until it reaches a dead state. There is no backtracking.
+
+    A prefilter with the literals that every match contains can be given,
+    so that texts without them are discarded before scanning, and the rest
+    of a text is skipped once it no longer contains them.
+
+    Args:
+        automaton: Automaton whose language is searched.
+        prefilter: Prefilter of the language of the automaton.
+
+    """
+
+    forward: CompiledAutomaton
+    backward: CompiledAutomaton
+    prefilter: Optional[Prefilter]
+
+    def __init__(
+        self,
+        automaton: FiniteAutomaton,
+        prefilter: Optional[Prefilter] = None,
+    ) -> None:
+        self.prefilter = prefilter
+        self.forward = automaton.to_minimized().compile()
+        self.backward = _reverse_with_prefix(automaton).to_minimized().compile()
+
+        # Estados desde los que ya no se puede llegar a un final
+        forward = self.forward
+        n_columns = forward.n_columns
+        predecessors: List[List[int]] = [[] for _ in range(forward.n_states)]
+        for i, target in enumerate(forward.table):
+            if target >= 0:
+                predecessors[target].append(i // n_columns)
+
+        live = bytearray(forward.finals)
+        to_visit = [q for q in range(forward.n_states) if live[q]]
+        while to_visit:
+            q = to_visit.pop()
+            for p in predecessors[q]:
+                if not live[p]:
+                    live[p] = 1
+                    to_visit.append(p)
+        self._live = bytes(live)
+
+    def _match_starts(self, text: str) -> bytearray:
+        """Mark with a 1 the positions of the text where a match starts."""
+        backward = self.backward
+        table = backward.table
+        symbol_index = backward.symbol_index
+        n_columns = backward.n_columns
+        finals = backward.finals
+
+        starts = bytearray(len(text) + 1)
+        state = backward.initial
+        starts[len(text)] = finals[state]
+        for i in range(len(text) - 1, -1, -1):
+            index = symbol_index.get(text[i])
+            # Un simbolo fuera del alfabeto solo deja vivo el prefijo Σ*
+            if index is None:
+                state = backward.initial
+            else:
+                state = table[state * n_columns + index]
+            starts[i] = finals[state]
+
+        return starts
+
+    def _match_end(self, text: str, start: int) -> int:
+        """Obtain the end of the longest match that starts at a position."""
+        forward = self.forward
+        table = forward.table
+        symbol_index = forward.symbol_index
+        n_columns = forward.n_columns
+        finals = forward.finals
+        live = self._live
+
+        state = forward.initial
+        end = start
+        for i in range(start, len(text)):
+            index = symbol_index.get(text[i])
+            if index is None:
+                break
+
+            state = table[state * n_columns + index]
+            if state < 0 or not live[state]:
+                break
+
+            if finals[state]:
+                end = i + 1
+
+        return end
+
+    def search(self, text: str) -> Optional[_Span]:
+        """
+        Find the leftmost-longest match in a text.
+
+        Args:
+            text: Text to search.
+
+        Returns:
+            Span ``(start, end)`` of the match, so that it is
+            ``text[start:end]``, or ``None`` if there is no match.
+
+        """
+        if self.prefilter is not None and not self.prefilter.might_match(text):
+            return None
+
+        start = self._match_starts(text).find(1)
+        if start < 0:
+            return None
+
+        return start, self._match_end(text, start)
+
+    def finditer(self, text: str) -> Iterator[_Span]:
+        """
+        Find all the non-overlapping leftmost-longest matches in a text.
+
+        As in the ``re`` module, the search goes on where the previous
+        match ended, one position further after an empty match.
+
+        Args:
+            text: Text to search.
+
+        Returns:
+            Iterator with the span ``(start, end)`` of every match.
+
+        """
+        prefilter = self.prefilter
+        if prefilter is not None and not prefilter.might_match(text):
+            return
+
+        starts = self._match_starts(text)
+        pos = 0
+        while True:
+            # Las siguientes coincidencias estan dentro de text[pos:]
+            if prefilter is not None and not prefilter.might_match(text, pos):
+                return
+
+            start = starts.find(1, pos)
+            if start < 0:
+                return
+
+            end = self._match_end(text, start)
+            yield start, end
+            pos = end if end > start else end + 1
@@ -0,0 +1,114 @@
+"""Test states, transitions and their indexing."""
+import unittest
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.automaton import FiniteAutomaton, State, Transition
+
+
+class TestStateAndTransition(unittest.TestCase):
+    """Tests for the hash and equality of states and transitions."""
+
+    def test_state_hash(self) -> None:
+        """Test that the hash of a state only depends on its name."""
+        q0 = State("q0")
+        q0_copy = State("q0")
+        q0_final = State("q0", is_final=True)
+
+        self.assertEqual(q0, q0_copy)
+        self.assertEqual(hash(q0), hash(q0_copy))
+        self.assertNotEqual(q0, q0_final)
+        self.assertEqual(hash(q0), hash(q0_final))
+
+        # Cambiar is_final no saca al estado de los conjuntos
+        states = {q0}
+        q0.is_final = True
+        self.assertIn(q0, states)
+        self.assertIn(q0_final, states)
+        self.assertNotIn(q0_copy, states)
+
+    def test_transition_hash(self) -> None:
+        """Test that equal transitions have the same hash."""
+        t = Transition(State("q0"), "a", State("q1", is_final=True))
+        t_copy = Transition(State("q0"), "a", State("q1", is_final=True))
+
+        self.assertEqual(t, t_copy)
+        self.assertEqual(hash(t), hash(t_copy))
+        self.assertEqual(len({t, t_copy}), 1)
+        self.assertNotEqual(t, Transition(State("q0"), "a", State("q1")))
+        self.assertNotEqual(t, Transition(State("q0"), None, t.final_state))
+
+        # La transicion sigue en el conjunto aunque cambie un estado
+        transitions = {t}
+        t.final_state.is_final = False
+        self.assertIn(t, transitions)
+
+    def test_slots(self) -> None:
+        """Test that states and transitions have no instance dictionary."""
+        q0 = State("q0")
+        self.assertFalse(hasattr(q0, "__dict__"))
+        self.assertFalse(hasattr(Transition(q0, "a", q0), "__dict__"))
+        self.assertEqual(q0.patterns, frozenset())
+
+
+class TestIndexTransitions(unittest.TestCase):
+    """Tests for the transitions indexed in the states."""
+
+    def test_many_targets(self) -> None:
+        """Test a state with many targets for the same symbol."""
+        q0 = State("q0")
+        targets = [State(str(i), is_final=True) for i in range(20000)]
+        automaton = FiniteAutomaton(
+            initial_state=q0,
+            states=[q0, *targets],
+            symbols=[],
+            transitions=[Transition(q0, None, st) for st in targets],
+        )
+
+        self.assertEqual(q0.get_transitions(None), tuple(targets))
+        self.assertEqual(automaton.states[1].get_transitions(None), ())
+
+    def test_equal_states(self) -> None:
+        """Test transitions whose states are equal, but other objects."""
+        q0 = State("q0")
+        q1 = State("q1", is_final=True)
+        FiniteAutomaton(
+            initial_state=q0,
+            states=[q0, q1],
+            symbols=["a"],
+            transitions=[
+                Transition(State("q0"), "a", q1),
+                Transition(q0, "a", State("q0")),
+            ],
+        )
+
+        self.assertEqual(q0.get_transitions("a"), (q1, q0))
+
+    def test_shared_states(self) -> None:
+        """Test states reused by another automaton, as the parsers do."""
+        q0 = State("q0")
+        q1 = State("q1", is_final=True)
+        transition = Transition(q0, "a", q1)
+        FiniteAutomaton.from_trusted(
+            initial_state=q0,
+            states=[q0, q1],
+            symbols=["a"],
+            transitions=[transition],
+        )
+        q2 = State("q2", is_final=True)
+        FiniteAutomaton.from_trusted(
+            initial_state=q0,
+            states=[q0, q1, q2],
+            symbols=["a"],
+            transitions=[transition, Transition(q0, "a", q2)],
+        )
+
+        # Los destinos que ya tenia se mantienen, sin repetirse
+        self.assertEqual(q0.get_transitions("a"), (q1, q2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Test the cache of automata."""
+import os
+import tempfile
+import unittest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.cache import AutomatonCache
+from automata.operations import equivalent
+from automata.re_parser import REParser
+from automata.utils import is_deterministic
+
+
+class TestAutomatonCache(unittest.TestCase):
+    """Tests for the memory and disk caches."""
+
+    def test_memory(self) -> None:
+        """Test hits, options and LRU eviction."""
+        cache = AutomatonCache(max_size=2)
+
+        minimized = cache.get("(a+b)*.c")
+        self.assertIs(cache.get("(a+b)*.c"), minimized)
+        self.assertTrue(is_deterministic(minimized))
+        self.assertTrue(
+            equivalent(minimized, REParser().create_automaton("(a+b)*.c")),
+        )
+        self.assertIsNot(cache.get("(a+b)*.c", stage="nfa"), minimized)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # El menos usado se descarta
+        cache.get("a*", construction="glushkov")
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(cache.get("(a+b)*.c"), minimized)
+
+        with self.assertRaises(ValueError):
+            cache.get("a", stage="compiled")
+
+    def test_disk(self) -> None:
+        """Test that minimized automata are reused from disk."""
+        with tempfile.TemporaryDirectory() as directory:
+            first = AutomatonCache(directory=directory).get("a.b*+c")
+            files = os.listdir(directory)
+            self.assertEqual(len(files), 1)
+            self.assertTrue(files[0].endswith(".json"))
+
+            second = AutomatonCache(directory=directory).get("a.b*+c")
+            self.assertIsNot(second, first)
+            self.assertTrue(equivalent(first, second))
+
+            # Un fichero corrupto se vuelve a construir
+            corrupted = ["{", "[]", "null", '{"version": 1, "states": 3}']
+            for contents in corrupted:
+                with self.subTest(contents=contents):
+                    with open(os.path.join(directory, files[0]), "w") as f:
+                        f.write(contents)
+                    third = AutomatonCache(directory=directory).get("a.b*+c")
+                    self.assertTrue(equivalent(first, third))
+                    self.assertEqual(os.listdir(directory), files)
+
+
+if __name__ == '__main__':
+    unittest.main()
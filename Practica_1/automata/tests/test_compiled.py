@@ -0,0 +1,194 @@
+"""Test compiled automata."""
+import pickle
+import unittest
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.automaton import FiniteAutomaton
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.compiled import CompiledAutomaton, match_parallel
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for batch matching
+    np = None
+
+
+class TestCompiled(unittest.TestCase):
+    """Tests for the compiled transition table."""
+
+    def _create_automaton(self) -> FiniteAutomaton:
+
+        description = """
+        Automaton:
+            Symbols: 01-.
+
+            initial
+            sign
+            int final
+            dot
+            decimal final
+
+            --> initial
+            initial ---> sign
+            initial --> sign
+            sign -0-> int
+            sign -1-> int
+            int -0-> int
+            int -1-> int
+            int -.-> dot
+            dot -0-> decimal
+            dot -1-> decimal
+            decimal -0-> decimal
+            decimal -1-> decimal
+        """
+
+        return AutomataFormat.read(description)
+
+    def _check_same_language(
+        self,
+        automaton: FiniteAutomaton,
+        compiled: CompiledAutomaton,
+        strings: list,
+    ) -> None:
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        for string in strings:
+            with self.subTest(string=string):
+                self.assertEqual(
+                    compiled.accepts(string),
+                    evaluator.accepts(string),
+                )
+
+    def test_compile_nondeterministic(self) -> None:
+        """Test that nondeterministic automata are determinized."""
+        automaton = self._create_automaton()
+        compiled = automaton.compile()
+
+        self._check_same_language(
+            automaton,
+            compiled,
+            ["", "0", "-0", "1.0", "-101.010", "0.", ".0", "0.0.0", "0-0.0"],
+        )
+        with self.assertRaises(ValueError):
+            compiled.accepts("0a")
+
+    def test_compile_regex(self) -> None:
+        """Test compilation of a regex automaton."""
+        automaton = REParser().create_automaton("(a+b)*.c")
+        compiled = automaton.compile()
+
+        self._check_same_language(
+            automaton,
+            compiled,
+            ["", "c", "abc", "ab", "cc", "bbbac", "abca"],
+        )
+
+    def test_accepts_many(self) -> None:
+        """Test batch matching against one by one matching."""
+        compiled = REParser().create_automaton("(a+b)*.c").compile()
+        strings = ["", "c", "abc", "ab", "cc", "bbbac", "abca", "aaaaaaaac"]
+
+        self.assertEqual(
+            [bool(accepted) for accepted in compiled.accepts_many(strings)],
+            [compiled.accepts(string) for string in strings],
+        )
+        self.assertEqual(len(compiled.accepts_many([])), 0)
+        with self.assertRaises(ValueError):
+            compiled.accepts_many(["abc", "abd"])
+
+    @unittest.skipUnless(np is not None, "NumPy is not installed")
+    def test_accepts_many_numpy(self) -> None:
+        """Test the vectorized batch matching of NumPy."""
+        cases = {
+            "(a+b)*.c": ["", "c", "abc", "ab", "cc", "bbbac", "abca"],
+            "(α+β)*.€": ["", "€", "αβ€", "αβ", "€€", "ββα€"],
+            # Mas de 256 columnas, que no caben en el relleno uint8
+            "+".join(chr(0x100 + i) + ".a" for i in range(300)): [
+                "", "a", chr(0x100) + "a", chr(0x1ff) + "a", chr(0x1ff) * 2,
+            ],
+        }
+        for regex, strings in cases.items():
+            for from_end in (False, True):
+                with self.subTest(regex=regex[:10], from_end=from_end):
+                    compiled = REParser().create_automaton(regex).compile(
+                        from_end=from_end,
+                    )
+                    accepted = compiled.accepts_many(strings)
+
+                    self.assertIsInstance(accepted, np.ndarray)
+                    self.assertEqual(
+                        accepted.tolist(),
+                        [compiled.accepts(string) for string in strings],
+                    )
+
+        # Las tablas se crean una sola vez por automata
+        tables = compiled._get_batch_tables()
+        compiled.accepts_many(strings)
+        self.assertIs(compiled._get_batch_tables(), tables)
+        with self.assertRaises(ValueError):
+            compiled.accepts_many(["a", "\U0010ffff"])
+
+    def test_immutable(self) -> None:
+        """Test that compiled automata cannot be modified."""
+        compiled = REParser().create_automaton("a*.b").compile()
+        with self.assertRaises(AttributeError):
+            compiled.initial = 1  # type: ignore[misc]
+
+    def test_match_parallel(self) -> None:
+        """Test matching in worker processes keeps the input order."""
+        compiled = REParser().create_automaton("(a+b)*.c").compile()
+        strings = ["abc", "ab", "c", "cc", "bac"] * 50
+
+        self.assertEqual(
+            list(match_parallel(compiled, strings, workers=2, chunk_size=7)),
+            [compiled.accepts(string) for string in strings],
+        )
+
+    def test_symbol_classes(self) -> None:
+        """Test that interchangeable symbols share a column."""
+        automaton = REParser().create_automaton("(a+b+c+d).x").to_minimized()
+        self.assertEqual(
+            automaton.symbol_classes(),
+            [("a", "b", "c", "d"), ("x",)],
+        )
+
+        compiled = automaton.compile()
+        self.assertEqual(compiled.n_columns, 2)
+        self._check_same_language(
+            automaton,
+            compiled,
+            ["", "ax", "dx", "xx", "ab", "cxx"],
+        )
+        self.assertEqual(
+            pickle.loads(pickle.dumps(compiled)).symbol_index,
+            compiled.symbol_index,
+        )
+
+    def test_from_end(self) -> None:
+        """Test suffix matching with the reversed automaton."""
+        automaton = self._create_automaton()
+        compiled = automaton.compile(from_end=True)
+        strings = ["", "0", "-0", "1.0", "-101.010", "0.", ".0", "0.0.0"]
+
+        self.assertTrue(compiled.from_end)
+        self._check_same_language(automaton, compiled, strings)
+        self.assertEqual(
+            [bool(accepted) for accepted in compiled.accepts_many(strings)],
+            [compiled.accepts(string) for string in strings],
+        )
+        # Se rechaza al leer el ultimo simbolo, sin mirar el resto
+        self.assertFalse(compiled.accepts("a" * 10 + "."))
+
+    def test_from_automaton_requires_deterministic(self) -> None:
+        """Test that only deterministic automata can be compiled directly."""
+        with self.assertRaises(ValueError):
+            CompiledAutomaton.from_automaton(self._create_automaton())
+
+
+if __name__ == '__main__':
+    unittest.main()
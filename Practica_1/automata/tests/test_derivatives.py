@@ -0,0 +1,192 @@
+"""Test derivative-based matching."""
+import subprocess
+import unittest
+from itertools import product
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.derivatives import DerivativeMatcher, derivative
+from automata.operations import equivalent
+from automata.re_ast import (
+    Empty,
+    Lambda,
+    Star,
+    Symbol,
+    Union,
+    concat,
+    parse,
+    simplify,
+    star,
+    to_rpn,
+    union,
+)
+from automata.re_parser import REParser
+from automata.utils import is_deterministic
+
+
+class TestRegexAST(unittest.TestCase):
+    """Tests for the hash-consed syntax trees."""
+
+    def test_hash_consing(self) -> None:
+        """Test that equal trees are the same object."""
+        self.assertIs(parse("(a+b)*.c"), parse("(a+b)*.c"))
+        self.assertIsNot(parse("a+b"), parse("b+a"))
+        self.assertIs(
+            parse("a+b", normalize=True),
+            parse("b+a", normalize=True),
+        )
+
+    def test_smart_constructors(self) -> None:
+        """Test the identities applied by the smart constructors."""
+        a = Symbol("a")
+        b = Symbol("b")
+
+        self.assertIs(union([a, Empty(), a]), a)
+        self.assertIs(union([]), Empty())
+        self.assertIs(concat(Lambda(), a), a)
+        self.assertIs(concat(a, Empty()), Empty())
+        self.assertIs(concat(concat(a, b), a), concat(a, concat(b, a)))
+        self.assertIs(
+            concat(concat(concat(a, b), a), b),
+            concat(a, concat(b, concat(a, b))),
+        )
+        self.assertIs(
+            parse("a.b.c.d.e", normalize=True),
+            parse("a.(b.(c.(d.e)))", normalize=True),
+        )
+        self.assertIs(
+            parse("(a.b).(c.d)", normalize=True),
+            parse("((a.b).c).d", normalize=True),
+        )
+        self.assertIs(star(Star(a)), Star(a))
+        self.assertIs(star(Lambda()), Lambda())
+
+    def test_simplify(self) -> None:
+        """Test simplification and left-factoring."""
+        cases = {
+            "λ.a": "a",
+            "(a*)*": "a*",
+            "a+a": "a",
+            "(λ+a)*": "a*",
+            "λ+a*": "a*",
+            "a.b+a.c": "a.(b+c)",
+            "a.b.c+a.b.d+a": "a.(λ+b.(c+d))",
+            "a.b.c.d+a.b.c.e": "a.b.c.(d+e)",
+            "a.b.c.d+a.b.x": "a.b.(x+c.d)",
+            "(a.b).(c.d.e)+a.(b.c).f": "a.b.c.(d.e+f)",
+            "": "",
+        }
+        for regex, expected in cases.items():
+            with self.subTest(regex=regex):
+                self.assertIs(
+                    simplify(parse(regex)),
+                    parse(expected, normalize=True),
+                )
+                self.assertEqual(
+                    to_rpn(simplify(parse(regex))),
+                    to_rpn(parse(expected, normalize=True)),
+                )
+
+    def test_union_order(self) -> None:
+        """Test that unions are ordered by structure, not by creation."""
+        a = Symbol("a")
+        self.assertIs(
+            union([concat(a, Symbol("b")), star(a), Symbol("c")]),
+            Union(Symbol("c"), star(a), concat(a, Symbol("b"))),
+        )
+
+        # Otro proceso crea los nodos en otro orden y con otra semilla de
+        # hash, pero debe obtener la misma union
+        script = (
+            "import sys; sys.path.insert(0, {path!r})\n"
+            "from automata.re_ast import Symbol, parse, simplify, to_rpn\n"
+            "{warmup}"
+            "print(to_rpn(simplify(parse('z.y+x*+(y.x+z)*+w'))))\n"
+        )
+        path = os.path.join(os.path.dirname(__file__), "..", "..")
+        outputs = set()
+        for seed, warmup in (
+            ("1", ""),
+            ("2", "symbols = [Symbol(c) for c in 'wxyz']\n"),
+        ):
+            outputs.add(subprocess.run(
+                [sys.executable, "-c", script.format(path=path, warmup=warmup)],
+                capture_output=True,
+                check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                text=True,
+            ).stdout)
+
+        self.assertEqual(len(outputs), 1)
+
+    def test_derivative(self) -> None:
+        """Test derivatives of a star."""
+        regex = parse("(a.b)*", normalize=True)
+
+        self.assertIs(
+            derivative(regex, "a"),
+            concat(Symbol("b"), regex),
+        )
+        self.assertIs(derivative(derivative(regex, "a"), "b"), regex)
+        self.assertIs(derivative(regex, "b"), Empty())
+
+
+class TestDerivativeMatcher(unittest.TestCase):
+    """Tests for the lazy DFA of derivatives."""
+
+    regexes = [
+        "H.e.l.l.o",
+        "a*.b*",
+        "(a+b)*.c.(a+λ)",
+        "((a+λ)*.b)*+c",
+        "(b+a.b*.a)*",
+        "λ",
+        "",
+    ]
+
+    def test_accepts(self) -> None:
+        """Test acceptance against the Thompson automaton."""
+        for regex in self.regexes:
+            matcher = DerivativeMatcher(regex)
+            evaluator = FiniteAutomatonEvaluator(
+                REParser().create_automaton(regex),
+            )
+            symbols = sorted(matcher.symbols)
+            for length in range(5):
+                for string in map("".join, product(symbols, repeat=length)):
+                    with self.subTest(regex=regex, string=string):
+                        self.assertEqual(
+                            matcher.accepts(string),
+                            evaluator.accepts(string),
+                        )
+
+        with self.assertRaises(ValueError):
+            DerivativeMatcher("a*").accepts("ab")
+
+    def test_long_nullable_chain(self) -> None:
+        """Test a long concatenation of nullable factors."""
+        matcher = DerivativeMatcher(".".join(["a*"] * 1500 + ["b"]))
+
+        self.assertTrue(matcher.accepts("b"))
+        self.assertTrue(matcher.accepts("aab"))
+        self.assertFalse(matcher.accepts("a"))
+        self.assertFalse(matcher.accepts("aba"))
+
+    def test_to_automaton(self) -> None:
+        """Test Brzozowski's construction of the whole DFA."""
+        for regex in self.regexes:
+            with self.subTest(regex=regex):
+                automaton = DerivativeMatcher(regex).to_automaton()
+
+                self.assertTrue(is_deterministic(automaton))
+                self.assertTrue(
+                    equivalent(automaton, REParser().create_automaton(regex)),
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
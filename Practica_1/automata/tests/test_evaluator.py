@@ -1,4 +1,6 @@
 """Test evaluation of automatas."""
+import io
+import tempfile
 import unittest
 from abc import ABC, abstractmethod
 from typing import Optional, Type
@@ -9,7 +11,12 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 from automata.automaton import FiniteAutomaton
-from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.automaton_evaluator import (
+    BitsetFiniteAutomatonEvaluator,
+    FiniteAutomatonEvaluator,
+    LazyDeterministicEvaluator,
+)
+from automata.interfaces import AbstractFiniteAutomatonEvaluator
 from automata.utils import AutomataFormat
 
 
@@ -17,7 +24,10 @@ class TestEvaluatorBase(ABC, unittest.TestCase):
     """Base class for string acceptance tests."""
 
     automaton: FiniteAutomaton
-    evaluator: FiniteAutomatonEvaluator
+    evaluator: AbstractFiniteAutomatonEvaluator
+    evaluator_class: Type[AbstractFiniteAutomatonEvaluator] = (
+        FiniteAutomatonEvaluator
+    )
 
     @abstractmethod
     def _create_automata(self) -> FiniteAutomaton:
@@ -26,7 +36,7 @@ class TestEvaluatorBase(ABC, unittest.TestCase):
     def setUp(self) -> None:
         """Set up the tests."""
         self.automaton = self._create_automata()
-        self.evaluator = FiniteAutomatonEvaluator(self.automaton)
+        self.evaluator = self.evaluator_class(self.automaton)
 
     def _check_accept_body(
         self,
@@ -116,6 +126,42 @@ class TestEvaluatorLambdas(TestEvaluatorBase):
         self._check_accept("a", exception=ValueError)
 
 
+class TestEvaluatorLambdaCycles(TestEvaluatorBase):
+    """Test for lambda transitions forming cycles."""
+
+    def _create_automata(self) -> FiniteAutomaton:
+
+        description = """
+        Automaton:
+            Symbols: ab
+
+            1
+            2
+            3
+            4
+            5 final
+
+            --> 1
+            1 --> 2
+            2 --> 3
+            3 --> 1
+            3 -a-> 4
+            4 --> 5
+            5 --> 4
+            5 -b-> 1
+        """
+
+        return AutomataFormat.read(description)
+
+    def test_lambda_cycles(self) -> None:
+        """Test closures of lambda cycles."""
+        self._check_accept("", should_accept=False)
+        self._check_accept("a", should_accept=True)
+        self._check_accept("aba", should_accept=True)
+        self._check_accept("ab", should_accept=False)
+        self._check_accept("aa", should_accept=False)
+
+
 class TestEvaluatorNumber(TestEvaluatorBase):
     """Test for a fixed string."""
 
@@ -163,6 +209,107 @@ class TestEvaluatorNumber(TestEvaluatorBase):
         self._check_accept("0.0.0", should_accept=False)
         self._check_accept("0-0.0", should_accept=False)
 
+    def test_stream(self) -> None:
+        """Test processing of text and binary streams."""
+        evaluator = self.evaluator
+        evaluator.process_stream(io.StringIO("-101.010"), chunk_size=3)
+        self.assertTrue(evaluator.is_accepting())
+
+        evaluator = self.evaluator_class(self.automaton)
+        evaluator.process_stream(io.BytesIO(b"-101.010"), chunk_size=2)
+        self.assertTrue(evaluator.is_accepting())
+
+        evaluator = self.evaluator_class(self.automaton)
+        finished = evaluator.process_stream(
+            io.StringIO("0-" + "a" * 10),
+            chunk_size=2,
+            stop_if_dead=True,
+        )
+        self.assertFalse(finished)
+        self.assertTrue(evaluator.is_dead())
+
+    def test_stream_dies_mid_chunk(self) -> None:
+        """Test that symbols after dying in a chunk are not checked."""
+        for stream in (io.StringIO("0-aaaa"), io.BytesIO(b"0-aaaa")):
+            with self.subTest(stream=type(stream).__name__):
+                evaluator = self.evaluator_class(self.automaton)
+                finished = evaluator.process_stream(
+                    stream,
+                    chunk_size=4,
+                    stop_if_dead=True,
+                )
+                self.assertFalse(finished)
+                self.assertTrue(evaluator.is_dead())
+
+    def test_mmap(self) -> None:
+        """Test processing of memory mapped files."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "number.txt")
+            with open(path, "w") as f:
+                f.write("-101.01")
+
+            self.assertTrue(self.evaluator.process_mmap(path, chunk_size=4))
+            self.assertTrue(self.evaluator.is_accepting())
+
+            evaluator = self.evaluator_class(self.automaton)
+            with open(path, "w") as f:
+                f.write("")
+
+            self.assertTrue(evaluator.process_mmap(path))
+            self.assertFalse(evaluator.is_accepting())
+
+
+class TestBitsetEvaluatorFixed(TestEvaluatorFixed):
+    """Test for a fixed string with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestBitsetEvaluatorLambdas(TestEvaluatorLambdas):
+    """Test lambda transitions with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestBitsetEvaluatorLambdaCycles(TestEvaluatorLambdaCycles):
+    """Test lambda cycles with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestBitsetEvaluatorNumber(TestEvaluatorNumber):
+    """Test for numbers with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestLazyEvaluatorLambdaCycles(TestEvaluatorLambdaCycles):
+    """Test lambda cycles with the lazy deterministic evaluator."""
+
+    evaluator_class = LazyDeterministicEvaluator
+
+
+class TestLazyEvaluatorNumber(TestEvaluatorNumber):
+    """Test for numbers with the lazy deterministic evaluator."""
+
+    evaluator_class = LazyDeterministicEvaluator
+
+
+class TestLazyEvaluatorSmallCache(TestEvaluatorNumber):
+    """Test for numbers with a lazy evaluator that must evict transitions."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.automaton = self._create_automata()
+        self.evaluator = LazyDeterministicEvaluator(
+            self.automaton,
+            max_cache_size=2,
+        )
+
+    def test_cache_bound(self) -> None:
+        """Test that the cache never exceeds its budget."""
+        self._check_accept("-101.010", should_accept=True)
+        self.assertLessEqual(len(self.evaluator._cache), 2)
 
 if __name__ == '__main__':
     unittest.main()
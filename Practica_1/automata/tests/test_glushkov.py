@@ -0,0 +1,61 @@
+"""Test Glushkov automata."""
+import unittest
+from itertools import product
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.glushkov import GlushkovParser
+from automata.re_parser import REParser
+
+
+class TestGlushkov(unittest.TestCase):
+    """Tests for the position automaton construction."""
+
+    regexes = [
+        "H.e.l.l.o",
+        "a*.b*",
+        "(a+b)*",
+        "(a+b)*.c.(a+λ)",
+        "((a+λ)*.b)*+c",
+        "(b+a.b*.a)*",
+        "λ",
+        "",
+    ]
+
+    def test_size(self) -> None:
+        """Test one state per position and no lambda transitions."""
+        for regex in self.regexes:
+            with self.subTest(regex=regex):
+                automaton = GlushkovParser().create_automaton(regex)
+                n_positions = sum(1 for x in regex if x.isalpha() and x != "λ")
+
+                self.assertEqual(len(automaton.states), n_positions + 1)
+                self.assertTrue(
+                    all(t.symbol is not None for t in automaton.transitions),
+                )
+
+    def test_language(self) -> None:
+        """Test that the language is the one of the Thompson automaton."""
+        for regex in self.regexes:
+            glushkov = FiniteAutomatonEvaluator(
+                GlushkovParser().create_automaton(regex),
+            )
+            thompson = FiniteAutomatonEvaluator(
+                REParser().create_automaton(regex),
+            )
+            symbols = sorted(set(thompson.automaton.symbols))
+            for length in range(5):
+                for string in map("".join, product(symbols, repeat=length)):
+                    with self.subTest(regex=regex, string=string):
+                        self.assertEqual(
+                            glushkov.accepts(string),
+                            thompson.accepts(string),
+                        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""Test boolean operations on automata."""
+import unittest
+from itertools import product
+from typing import Callable
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.automaton import FiniteAutomaton
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.operations import (
+    complement,
+    difference,
+    equivalent,
+    find_counterexample,
+    intersection,
+    is_disjoint,
+    is_empty,
+    is_subset,
+    is_universal,
+    union,
+)
+from automata.re_parser import REParser
+from automata.utils import is_deterministic
+
+
+class TestOperations(unittest.TestCase):
+    """Tests for the lazy product constructions."""
+
+    def _create_automaton(self, regex: str) -> FiniteAutomaton:
+        return REParser().create_automaton(regex)
+
+    def _accepts(self, automaton: FiniteAutomaton, string: str) -> bool:
+        try:
+            return FiniteAutomatonEvaluator(automaton).accepts(string)
+        except ValueError:
+            # Symbols outside the alphabet are rejected
+            return False
+
+    def _check_operation(
+        self,
+        result: FiniteAutomaton,
+        expected: Callable[[str], bool],
+        max_length: int = 5,
+    ) -> None:
+        self.assertTrue(is_deterministic(result))
+        for length in range(max_length + 1):
+            for symbols in product("abc", repeat=length):
+                string = "".join(symbols)
+                with self.subTest(string=string):
+                    self.assertEqual(
+                        self._accepts(result, string),
+                        expected(string),
+                    )
+
+    def test_operations(self) -> None:
+        """Test intersection, union, difference and complement."""
+        even_a = self._create_automaton("(b+a.b*.a)*")
+        ends_b = self._create_automaton("(a+b)*.b")
+
+        def in_even_a(string: str) -> bool:
+            return self._accepts(even_a, string)
+
+        def in_ends_b(string: str) -> bool:
+            return self._accepts(ends_b, string)
+
+        self._check_operation(
+            intersection(even_a, ends_b),
+            lambda s: in_even_a(s) and in_ends_b(s),
+        )
+        self._check_operation(
+            union(even_a, ends_b),
+            lambda s: in_even_a(s) or in_ends_b(s),
+        )
+        self._check_operation(
+            difference(even_a, ends_b),
+            lambda s: in_even_a(s) and not in_ends_b(s),
+        )
+        self._check_operation(
+            complement(ends_b, "abc"),
+            lambda s: not in_ends_b(s),
+        )
+
+    def test_reverse(self) -> None:
+        """Test that the reversed automaton accepts the reversed strings."""
+        for regex in ["a.b*.c", "(a+b)*.b.c", "λ", "a*.(b+c.c)"]:
+            automaton = self._create_automaton(regex)
+            reversed_automaton = automaton.reverse()
+            for length in range(5):
+                for symbols in product("abc", repeat=length):
+                    string = "".join(symbols)
+                    with self.subTest(regex=regex, string=string):
+                        self.assertEqual(
+                            self._accepts(reversed_automaton, string[::-1]),
+                            self._accepts(automaton, string),
+                        )
+
+    def test_queries(self) -> None:
+        """Test emptiness, disjointness and inclusion."""
+        a_star = self._create_automaton("a*")
+        a_plus = self._create_automaton("a.a*")
+        b_plus = self._create_automaton("b.b*")
+        a_or_b = self._create_automaton("(a+b)*")
+
+        self.assertFalse(is_empty(a_star))
+        self.assertTrue(is_empty(intersection(a_plus, b_plus)))
+        self.assertTrue(is_disjoint(a_plus, b_plus))
+        self.assertFalse(is_disjoint(a_star, a_plus))
+        self.assertTrue(is_subset(a_plus, a_star))
+        self.assertFalse(is_subset(a_star, a_plus))
+        self.assertTrue(is_subset(b_plus, a_or_b))
+        self.assertFalse(is_subset(a_or_b, b_plus))
+
+    def test_antichains(self) -> None:
+        """Test inclusion and universality on nondeterministic automata."""
+        # Strings whose fourth symbol from the end is an a
+        fourth_last_a = self._create_automaton("(a+b)*.a.(a+b).(a+b).(a+b)")
+        last_a = self._create_automaton("(a+b)*.a.(a+b)*")
+        a_or_b = self._create_automaton("(a+b)*")
+        a_star_b_star = self._create_automaton("(a*.b*)*")
+
+        self.assertTrue(is_subset(fourth_last_a, last_a))
+        self.assertFalse(is_subset(last_a, fourth_last_a))
+        self.assertTrue(is_subset(a_or_b, a_star_b_star))
+        self.assertTrue(is_subset(a_star_b_star, a_or_b))
+        self.assertTrue(is_subset(self._create_automaton("λ"), a_or_b))
+
+        self.assertTrue(is_universal(a_or_b))
+        self.assertTrue(is_universal(a_star_b_star))
+        self.assertTrue(is_universal(
+            union(fourth_last_a, complement(fourth_last_a, "ab")),
+        ))
+        self.assertFalse(is_universal(last_a))
+        self.assertFalse(is_universal(a_or_b, "abc"))
+
+    def test_equivalence(self) -> None:
+        """Test the Hopcroft-Karp equivalence check."""
+        a_or_b = self._create_automaton("(a+b)*")
+        a_then_b = self._create_automaton("(a*.b*)*")
+        self.assertTrue(equivalent(a_or_b, a_then_b))
+        self.assertTrue(equivalent(a_or_b, a_or_b.to_deterministic().to_minimized()))
+        self.assertIsNone(find_counterexample(a_or_b, a_then_b))
+
+        pairs = [
+            ("a*", "a.a*"),
+            ("(a+b)*.b", "(a+b)*.b.b"),
+            ("(a.b)*", "(a+b)*"),
+            ("a.b.c", "a.b"),
+        ]
+        for regex1, regex2 in pairs:
+            with self.subTest(regex1=regex1, regex2=regex2):
+                automaton1 = self._create_automaton(regex1)
+                automaton2 = self._create_automaton(regex2)
+                string = find_counterexample(automaton1, automaton2)
+                self.assertIsNotNone(string)
+                self.assertNotEqual(
+                    self._accepts(automaton1, string),
+                    self._accepts(automaton2, string),
+                )
+                self.assertFalse(equivalent(automaton1, automaton2))
+
+
+if __name__ == '__main__':
+    unittest.main()
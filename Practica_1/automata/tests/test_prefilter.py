@@ -0,0 +1,61 @@
+"""Test literal prefilters."""
+import unittest
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.prefilter import Prefilter, required_literals
+from automata.re_parser import REParser
+from automata.search import Searcher
+
+
+class TestPrefilter(unittest.TestCase):
+    """Tests for the required literals of a regex."""
+
+    def test_required_literals(self) -> None:
+        """Test the literals found in several regexes."""
+        cases = {
+            "H.e.l.l.o": {"Hello"},
+            "(a+b)*.c.o.d.e.(a+b)*": {"code"},
+            "a.b.(c+d)*.e.f": {"ab", "ef"},
+            "(a.b.c+x.b.c.y)": {"bc"},
+            "(f.o.o+b.a.r).z": {"z"},
+            "a*.b": {"b"},
+            "a*": set(),
+            "λ": set(),
+            "": set(),
+        }
+        for regex, expected in cases.items():
+            with self.subTest(regex=regex):
+                self.assertEqual(required_literals(regex), expected)
+
+    def test_might_match(self) -> None:
+        """Test discarding inputs, as strings and as bytes."""
+        prefilter = Prefilter.from_regex("(a+b)*.c.o.d.e.(a+b)*")
+
+        self.assertTrue(prefilter.might_match("abcodeb"))
+        self.assertFalse(prefilter.might_match("abcodb"))
+        self.assertTrue(prefilter.might_match(b"codea"))
+        self.assertFalse(prefilter.might_match(b"cod"))
+        self.assertTrue(Prefilter([]).might_match(""))
+
+    def test_searcher(self) -> None:
+        """Test that the prefilter does not change the matches."""
+        regex = "(a+b)*.c.o.d.e"
+        automaton = REParser().create_automaton(regex)
+        searcher = Searcher(automaton)
+        filtered = Searcher(automaton, Prefilter.from_regex(regex))
+
+        for text in ["xxabcodeabcode", "abcod", "", "code"]:
+            with self.subTest(text=text):
+                self.assertEqual(filtered.search(text), searcher.search(text))
+                self.assertEqual(
+                    list(filtered.finditer(text)),
+                    list(searcher.finditer(text)),
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,10 @@ import os
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
-from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.automaton_evaluator import (
+    BitsetFiniteAutomatonEvaluator,
+    FiniteAutomatonEvaluator,
+)
 from automata.re_parser import REParser
 
 
@@ -83,6 +86,96 @@ class TestREParser(unittest.TestCase):
         self._check_accept(evaluator, "13,", should_accept=True)
         self._check_accept(evaluator, "3,7,12", should_accept=False)
 
+    def test_simplify(self) -> None:
+        """Test that simplification removes states, not strings."""
+        regex = "(λ.a.b.c*)*+a.b.d+(a*)*+a+a"
+        simplified = REParser().create_automaton(regex)
+        unsimplified = REParser(simplify=False).create_automaton(regex)
+
+        self.assertLess(len(simplified.states), len(unsimplified.states))
+        evaluator = FiniteAutomatonEvaluator(simplified)
+        reference = FiniteAutomatonEvaluator(unsimplified)
+        for string in ["", "a", "aa", "ab", "abc", "abd", "abcab", "abdab"]:
+            self._check_accept(evaluator, string, reference.accepts(string))
+
+
+class TestMultiPattern(unittest.TestCase):
+    """Tests for automata built from several regexes."""
+
+    patterns = ["a.b*", "(a+b)*.b", "c", "", "a.b"]
+    expected = {
+        "a": {0},
+        "ab": {0, 1, 4},
+        "abb": {0, 1},
+        "b": {1},
+        "c": {2},
+        "": set(),
+        "ca": set(),
+    }
+
+    def test_match(self) -> None:
+        """Test that every transformation keeps the pattern ids."""
+        automaton = REParser().create_multi_automaton(self.patterns)
+        deterministic = automaton.to_deterministic()
+        minimized = automaton.to_minimized()
+
+        evaluators = [
+            evaluator_class(candidate)
+            for candidate in (automaton, deterministic, minimized)
+            for evaluator_class in (
+                FiniteAutomatonEvaluator,
+                BitsetFiniteAutomatonEvaluator,
+            )
+        ]
+        for evaluator in evaluators:
+            for string, expected in self.expected.items():
+                with self.subTest(string=string):
+                    self.assertEqual(evaluator.match(string), expected)
+                    self.assertEqual(
+                        evaluator.accepts(string),
+                        bool(expected),
+                    )
+
+        compiled = minimized.compile()
+        for string, expected in self.expected.items():
+            with self.subTest(string=string):
+                self.assertEqual(compiled.match(string), expected)
+
+    def test_minimized_keeps_patterns_apart(self) -> None:
+        """Test that equal languages of different patterns are not merged."""
+        automaton = REParser().create_multi_automaton(["a", "b"])
+        minimized = automaton.to_minimized()
+
+        self.assertEqual(len(minimized.states), 3)
+        self.assertEqual(
+            FiniteAutomatonEvaluator(minimized).match("b"),
+            {1},
+        )
+
+    def test_structure(self) -> None:
+        """Test that the patterns share one automaton, joined at the root."""
+        patterns = ["a", "b.c", "(a+b)*", ""]
+        automaton = REParser(simplify=False).create_multi_automaton(patterns)
+        separate = [
+            REParser(simplify=False).create_automaton(regex)
+            for regex in patterns
+        ]
+
+        # Una raiz con una transicion lambda por patron, y nada mas
+        targets = automaton.initial_state.get_transitions(None)
+        self.assertEqual(len(targets), len(patterns))
+        self.assertEqual(
+            len(automaton.states),
+            1 + sum(len(a.states) for a in separate),
+        )
+        self.assertEqual(
+            len(automaton.transitions),
+            len(patterns) + sum(len(a.transitions) for a in separate),
+        )
+        self.assertEqual(
+            [st.patterns for st in automaton.states if st.is_final],
+            [frozenset([i]) for i in range(len(patterns))],
+        )
 
 if __name__ == "__main__":
     unittest.main()
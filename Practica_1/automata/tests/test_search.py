@@ -0,0 +1,61 @@
+"""Test unanchored search of matches."""
+import unittest
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.re_parser import REParser
+from automata.search import Searcher
+
+
+class TestSearch(unittest.TestCase):
+    """Tests for search and finditer."""
+
+    def _create_searcher(self, regex: str) -> Searcher:
+        return Searcher(REParser().create_automaton(regex))
+
+    def test_search(self) -> None:
+        """Test leftmost-longest search."""
+        searcher = self._create_searcher("a.b*")
+
+        self.assertEqual(searcher.search("xxabbbab"), (2, 6))
+        self.assertEqual(searcher.search("bbb"), None)
+        self.assertEqual(searcher.search(""), None)
+
+    def test_leftmost_before_longest(self) -> None:
+        """Test that the leftmost match wins over a longer one."""
+        searcher = self._create_searcher("b.c+a.b.c.c.c")
+
+        self.assertEqual(searcher.search("abcccbc"), (0, 5))
+        self.assertEqual(searcher.search("xbcabccc"), (1, 3))
+
+    def test_symbols_outside_alphabet(self) -> None:
+        """Test that unknown symbols split matches."""
+        searcher = self._create_searcher("(a+b)*.b")
+
+        self.assertEqual(
+            list(searcher.finditer("abzbb-ab")),
+            [(0, 2), (3, 5), (6, 8)],
+        )
+
+    def test_finditer_empty_matches(self) -> None:
+        """Test that empty matches advance as in the re module."""
+        searcher = self._create_searcher("a*")
+
+        self.assertEqual(
+            list(searcher.finditer("baab")),
+            [(0, 0), (1, 3), (3, 3), (4, 4)],
+        )
+
+    def test_empty_language(self) -> None:
+        """Test an automaton without matches."""
+        searcher = self._create_searcher("")
+
+        self.assertEqual(searcher.search("abc"), None)
+        self.assertEqual(list(searcher.finditer("abc")), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
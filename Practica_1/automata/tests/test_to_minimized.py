@@ -8,7 +8,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from automata.automaton import FiniteAutomaton
+from automata.automaton import FiniteAutomaton, State, Transition
 from automata.automaton_evaluator import FiniteAutomatonEvaluator
 from automata.utils import AutomataFormat, deterministic_automata_isomorphism, write_dot
 
@@ -372,6 +372,92 @@ class TestEvaluatorBase(ABC, unittest.TestCase):
 
                 self._check_to_minimized(automaton, expected)
 
+    def test_case8(self) -> None:
+                """Test Case 8, partial automaton with unreachable and dead states"""
+                automaton_str = """
+                Automaton:
+                    Symbols: ab
+                    A
+                    B final
+                    C final
+                    D
+                    E
+                    --> A
+                    A -a-> B
+                    A -b-> C
+                    B -a-> D
+                    D -a-> D
+                    E -a-> A
+                """
+
+                automaton = AutomataFormat.read(automaton_str)
+
+                expected_str = """
+                Automaton:
+                    Symbols: ab
+                    A
+                    BC final
+                    --> A
+                    A -a-> BC
+                    A -b-> BC
+                """
+
+                expected = AutomataFormat.read(expected_str)
+
+                self._check_to_minimized(automaton, expected)
+
+    def test_case9(self) -> None:
+                """Test Case 9, sparse partial automaton with a large alphabet"""
+                # q0 -s_i-> p_i -z-> f_i para 100 simbolos s_i, mas una rama
+                # muerta con x, sobre un alfabeto de 302 simbolos
+                symbols = [chr(0x100 + i) for i in range(300)] + ["x", "z"]
+                q0 = State("q0")
+                dead = State("dead")
+                states = [q0, dead]
+                transitions = [
+                    Transition(q0, "x", dead),
+                    Transition(dead, "x", dead),
+                ]
+                for i in range(100):
+                    p = State(f"p{i}")
+                    f = State(f"f{i}", is_final=True)
+                    states.extend([p, f])
+                    transitions.extend([
+                        Transition(q0, symbols[i], p),
+                        Transition(p, "z", f),
+                    ])
+
+                automaton = FiniteAutomaton(
+                    initial_state=q0,
+                    states=states,
+                    symbols=symbols,
+                    transitions=transitions,
+                )
+
+                q0 = State("q0")
+                p = State("p")
+                f = State("f", is_final=True)
+                expected = FiniteAutomaton(
+                    initial_state=q0,
+                    states=[q0, p, f],
+                    symbols=symbols,
+                    transitions=[
+                        *(Transition(q0, symbols[i], p) for i in range(100)),
+                        Transition(p, "z", f),
+                    ],
+                )
+
+                self._check_to_minimized(automaton, expected)
+
+                # Sigue siendo parcial: sin sumidero ni transiciones nuevas
+                minimized = automaton.to_minimized()
+                self.assertEqual(len(minimized.states), 3)
+                self.assertEqual(len(minimized.transitions), 101)
+                self.assertEqual(set(minimized.symbols), set(symbols))
+                evaluator = FiniteAutomatonEvaluator(minimized)
+                self.assertTrue(evaluator.accepts(symbols[99] + "z"))
+                self.assertFalse(evaluator.accepts(symbols[100] + "z"))
+                self.assertFalse(evaluator.accepts("x"))
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 """General utilities to work with automatas."""
 import re
 from collections import defaultdict, deque
-from typing import DefaultDict, Dict, Mapping, Optional, Set
+from typing import DefaultDict, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from typing_extensions import Final
 
@@ -115,6 +115,37 @@ class AutomataFormat():
         )
 
 
+def symbol_ranges(symbols: Iterable[str]) -> List[str]:
+    """
+    Group symbols into ranges of consecutive code points.
+
+    Runs of three or more consecutive symbols are written as ``"a-c"``, and
+    shorter runs as the symbols themselves.
+
+    Args:
+        symbols: Symbols to group.
+
+    Returns:
+        Sorted list of ranges and single symbols.
+
+    """
+    ranges: List[str] = []
+    codes = sorted({ord(s) for s in symbols})
+    start = 0
+    for i in range(1, len(codes) + 1):
+        if i < len(codes) and codes[i] == codes[i - 1] + 1:
+            continue
+
+        first, last = codes[start], codes[i - 1]
+        if last - first >= 2:
+            ranges.append(f"{chr(first)}-{chr(last)}")
+        else:
+            ranges.extend(chr(c) for c in range(first, last + 1))
+        start = i
+
+    return ranges
+
+
 def write_dot(automaton: aut.FiniteAutomaton) -> str:
     """
     Write a dot representation of the automaton.
@@ -131,8 +162,18 @@ def write_dot(automaton: aut.FiniteAutomaton) -> str:
         False: "circle",
     }
 
-    def symbol_repr(symbol: Optional[str]) -> str:
-        return "λ" if symbol is None else symbol
+    # Etiquetas agrupadas por par de estados, con rangos de simbolos
+    labels: DefaultDict[
+        Tuple[aut.State, aut.State],
+        List[Optional[str]],
+    ] = defaultdict(list)
+    for t in automaton.transitions:
+        labels[t.initial_state, t.final_state].append(t.symbol)
+
+    def label_repr(symbols: List[Optional[str]]) -> str:
+        parts = ["λ"] if None in symbols else []
+        parts.extend(symbol_ranges(s for s in symbols if s is not None))
+        return ",".join(parts)
 
     return (
         "digraph {\n"
@@ -146,9 +187,9 @@ def write_dot(automaton: aut.FiniteAutomaton) -> str:
         + "\n"
         + f"  __start_point__ -> {automaton.initial_state.name}\n"
         + "".join(
-            f"  {t.initial_state.name} -> {t.final_state.name}"
-            f"[label=\"{symbol_repr(t.symbol)}\"]\n"
-            for t in automaton.transitions
+            f"  {initial.name} -> {final.name}"
+            f"[label=\"{label_repr(symbols)}\"]\n"
+            for (initial, final), symbols in labels.items()
         )
         + "}\n"
     )
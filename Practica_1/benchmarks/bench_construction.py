@@ -0,0 +1,100 @@
+"""Benchmark of the Thompson and Glushkov constructions on a regex corpus."""
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.automaton import FiniteAutomaton
+from automata.glushkov import GlushkovParser
+from automata.re_parser import REParser
+
+_DIGIT = "(0+1+2+3+4+5+6+7+8+9)"
+
+
+def corpus(n_alternatives: int, seed: int = 0) -> Dict[str, str]:
+    """
+    Create the corpus of regexes of the benchmark.
+
+    It has the regexes of the test suite and machine-generated ones: a long
+    union of literals, a keyword search and nested stars.
+
+    Args:
+        n_alternatives: Number of literals of the long union.
+        seed: Seed of the random generator.
+
+    Returns:
+        Regexes of the corpus, by name.
+
+    """
+    rng = random.Random(seed)
+    literals = "+".join(
+        "(" + ".".join(rng.choice("abcdef") for _ in range(6)) + ")"
+        for _ in range(n_alternatives)
+    )
+    any_symbol = "(a+b+c+d+e+f)"
+
+    return {
+        "hello": "H.e.l.l.o",
+        "number": f"({_DIGIT}.{_DIGIT}*.,.{_DIGIT}*)+{_DIGIT}*",
+        "even_a": "(b+a.b*.a)*",
+        "literals": literals,
+        "keyword": f"{any_symbol}*.c.a.f.e.{any_symbol}*",
+        "nested": "((a*.b*)*.(c+λ)*)*.d",
+    }
+
+
+def measure(
+    create: Callable[[str], FiniteAutomaton],
+    regex: str,
+) -> List[float]:
+    """Build and determinize a regex, returning sizes and seconds."""
+    start = time.perf_counter()
+    automaton = create(regex)
+    built = time.perf_counter()
+    deterministic = automaton.to_deterministic()
+    determinized = time.perf_counter()
+
+    return [
+        len(automaton.states),
+        len(automaton.transitions),
+        built - start,
+        determinized - built,
+        len(deterministic.states),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print one line per regex and construction."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--alternatives",
+        type=int,
+        default=1000,
+        help="number of literals of the long union",
+    )
+    args = parser.parse_args()
+
+    constructions = {
+        "thompson": REParser().create_automaton,
+        "glushkov": GlushkovParser().create_automaton,
+    }
+
+    print(
+        f"{'regex':>10} {'method':>10} {'states':>8} {'trans':>8} "
+        f"{'build s':>9} {'det s':>9} {'dfa':>8}",
+    )
+    for name, regex in corpus(args.alternatives).items():
+        for method, create in constructions.items():
+            states, transitions, build, det, dfa = measure(create, regex)
+            print(
+                f"{name:>10} {method:>10} {states:>8} {transitions:>8} "
+                f"{build:>9.4f} {det:>9.4f} {dfa:>8}",
+            )
+
+
+if __name__ == "__main__":
+    main()
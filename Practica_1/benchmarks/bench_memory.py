@@ -0,0 +1,63 @@
+"""Benchmark of the memory used by states and transitions."""
+import argparse
+import gc
+import random
+import tracemalloc
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.automaton import FiniteAutomaton, State, Transition
+
+
+def _traced_bytes() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def main() -> None:
+    """Run the benchmark and print the bytes used per object."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--states", type=int, default=100000)
+    parser.add_argument("--degree", type=int, default=3)
+    parser.add_argument("--symbols", default="abcd")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"q{i}" for i in range(args.states)]
+
+    tracemalloc.start()
+
+    start = _traced_bytes()
+    states = [State(name, is_final=rng.random() < 0.5) for name in names]
+    after_states = _traced_bytes()
+
+    transitions = {
+        Transition(st, rng.choice(args.symbols), rng.choice(states))
+        for st in states
+        for _ in range(args.degree)
+    }
+    after_transitions = _traced_bytes()
+
+    automaton = FiniteAutomaton(
+        initial_state=states[0],
+        states=states,
+        symbols=args.symbols,
+        transitions=transitions,
+    )
+    after_automaton = _traced_bytes()
+
+    tracemalloc.stop()
+
+    n_transitions = len(transitions)
+    print(f"states:      {len(states)}")
+    print(f"transitions: {n_transitions}")
+    print(f"bytes per state:             {(after_states - start) / len(states):8.1f}")
+    print(f"bytes per transition:        {(after_transitions - after_states) / n_transitions:8.1f}")
+    print(f"bytes per indexed transition: {(after_automaton - after_transitions) / n_transitions:7.1f}")
+    assert automaton.initial_state is states[0]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark of DFA minimization on random automata."""
+import argparse
+import random
+import time
+from typing import Optional
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.automaton import FiniteAutomaton, State, Transition
+
+
+def random_dfa(
+    n_states: int,
+    symbols: str = "ab",
+    degree: Optional[int] = None,
+    seed: int = 0,
+) -> FiniteAutomaton:
+    """
+    Create a random DFA.
+
+    Args:
+        n_states: Number of states.
+        symbols: Symbols of the automaton.
+        degree: Number of transitions of each state. By default, one per
+            symbol (a complete DFA).
+        seed: Seed of the random generator.
+
+    Returns:
+        Random deterministic automaton.
+
+    """
+    rng = random.Random(seed)
+    states = [
+        State(f"q{i}", is_final=rng.random() < 0.5)
+        for i in range(n_states)
+    ]
+    transitions = {
+        Transition(st, symbol, rng.choice(states))
+        for st in states
+        for symbol in (
+            symbols if degree is None else rng.sample(symbols, degree)
+        )
+    }
+
+    return FiniteAutomaton(
+        initial_state=states[0],
+        states=set(states),
+        symbols=symbols,
+        transitions=transitions,
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print one line per size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "sizes",
+        nargs="*",
+        type=int,
+        default=[1000, 10000, 100000, 200000],
+    )
+    parser.add_argument(
+        "--symbols",
+        type=int,
+        default=2,
+        help="size of the alphabet",
+    )
+    parser.add_argument(
+        "--degree",
+        type=int,
+        default=None,
+        help="transitions per state (partial DFA), by default one per symbol",
+    )
+    args = parser.parse_args()
+    symbols = "".join(chr(ord("0") + i) for i in range(args.symbols))
+
+    print(f"{'states':>10} {'minimal':>10} {'seconds':>10} {'us/state':>10}")
+    for n_states in args.sizes:
+        automaton = random_dfa(n_states, symbols, args.degree)
+
+        start = time.perf_counter()
+        minimized = automaton.to_minimized()
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{n_states:>10} {len(minimized.states):>10} "
+            f"{elapsed:>10.3f} {elapsed / n_states * 1e6:>10.2f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark of the scaling of automata built from many patterns."""
+import argparse
+import random
+import time
+from typing import List
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from automata.re_parser import REParser
+
+
+def patterns(n_patterns: int, length: int, seed: int = 0) -> List[str]:
+    """Create random literal patterns of the given length."""
+    rng = random.Random(seed)
+    return [
+        ".".join(rng.choice("abcdef") for _ in range(length))
+        for _ in range(n_patterns)
+    ]
+
+
+def measure(regexes: List[str], repeat: int) -> float:
+    """Best time to build the automaton of several patterns, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        REParser(simplify=False).create_multi_automaton(regexes)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """
+    Run the benchmark and print one line per number of patterns.
+
+    The number of patterns doubles on every line, so the time should about
+    double too: a ratio near 4 means quadratic behaviour.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--start", type=int, default=500)
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument(
+        "--length",
+        type=int,
+        default=1,
+        help="symbols per pattern; short patterns stress the common root",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'patterns':>9} {'seconds':>9} {'us/pattern':>11} {'ratio':>6}")
+    previous = None
+    for step in range(args.steps):
+        n_patterns = args.start << step
+        seconds = measure(patterns(n_patterns, args.length), args.repeat)
+        ratio = f"{seconds / previous:6.2f}" if previous else f"{'':>6}"
+        print(
+            f"{n_patterns:>9} {seconds:>9.4f} "
+            f"{seconds / n_patterns * 1e6:>11.1f} {ratio}",
+        )
+        previous = seconds
+
+
+if __name__ == "__main__":
+    main()